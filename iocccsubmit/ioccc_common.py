@@ -26,19 +26,23 @@ import string
 import secrets
 import random
 import shutil
-import glob
 import hashlib
 import uuid
 import logging
 import datetime
 import locale
 import bz2
+import stat
+import threading
+import time
 
 
 # import from modules
 #
 from string import Template
 from os import makedirs, umask
+from contextlib import contextmanager
+from collections import OrderedDict
 from pathlib import Path
 from random import randrange
 from logging.handlers import SysLogHandler
@@ -62,6 +66,29 @@ from filelock import Timeout, FileLock
 from werkzeug.security import check_password_hash, generate_password_hash
 
 
+# Optional faster JSON parsing
+#
+# When the orjson module is installed, we use orjson.loads() to parse JSON from bytes.
+# Otherwise we fall back to json.loads(), which also accepts UTF-8 encoded bytes.
+#
+#    https://pypi.org/project/orjson/
+#
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# JSON encoder for the JSON files that we write
+#
+# Calling json.dumps() with arguments such as indent forms a new json.JSONEncoder
+# on every call.  We form our JSON encoder once and reuse it.
+#
+# NOTE: We do not use orjson.dumps() because it can only indent by 2 spaces,
+#       and our JSON files are indented by 4 spaces.
+#
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=True, indent=4)
+
+
 ##################
 # Global constants
 ##################
@@ -70,7 +97,7 @@ from werkzeug.security import check_password_hash, generate_password_hash
 #
 # NOTE: Use string of the form: "x.y[.z] YYYY-MM-DD"
 #
-VERSION_IOCCC_COMMON = "2.9.5 2025-12-21"
+VERSION_IOCCC_COMMON = "2.9.6 2026-10-16"
 
 # force password change grace time
 #
@@ -95,18 +122,32 @@ DEFAULT_GRACE_PERIOD = 14*24*3600
 #
 # The date string produced by:
 #
-#   date_string = re.sub(r'\+00:00 ', ' ', f'{now} UTC')
+#   date_string = now.strftime(DATETIME_USEC_FORMAT)
 #
 # may be converted back into a datetime object by:
 #
 #   dt = datetime.datetime.strptime(date_string, DATETIME_USEC_FORMAT)
 #
+# or faster by:
+#
+#   dt = parse_datetime_usec(date_string)
+#
 # and then converted back into a date string again by:
 #
-#   date_string = re.sub(r'\+00:00 ', ' ', f'{dt} UTC')
+#   date_string = dt.strftime(DATETIME_USEC_FORMAT)
+#
+# NOTE: Unlike f'{now} UTC', strftime() always includes the microseconds, even when they are zero.
 #
 DATETIME_USEC_FORMAT = "%Y-%m-%d %H:%M:%S.%f UTC"
 
+# canonical DATETIME_USEC_FORMAT date string, as produced by the above
+#
+# A date string that fully matches DATETIME_USEC_RE may be converted by
+# datetime.datetime.fromisoformat() which is much faster than strptime().
+# See parse_datetime_usec().
+#
+DATETIME_USEC_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{6} UTC')
+
 # IP and port when running this code from the command line.
 #
 # When this code be being run under Apache, the wsgi module takes
@@ -189,6 +230,18 @@ MIN_SECRET_LEN = 15
 # POSIX safe filename regular expression
 #
 POSIX_SAFE_RE = "^[0-9A-Za-z][0-9A-Za-z._+-]*$"
+POSIX_SAFE_PATTERN = re.compile(POSIX_SAFE_RE)
+
+# submit filename regular expression
+#
+# A submit filename is of the form:
+#
+#   submit.username-slot_num.timestamp.txz
+#
+# where the username is group 1, the slot_num is group 2, and the timestamp is group 3.
+#
+SUBMIT_FILENAME_RE = r'^submit\.(.+)-([0-9]+)\.([1-9][0-9]{9,})\.txz$'
+SUBMIT_FILENAME_PATTERN = re.compile(SUBMIT_FILENAME_RE)
 
 # slot dictionary for slot JSON file
 #
@@ -206,6 +259,29 @@ EMPTY_JSON_SLOT_TEMPLATE = '''{
     "status": "slot is empty"
 }'''
 
+# empty slot as a python dictionary, formed once from EMPTY_JSON_SLOT_TEMPLATE for slot 0
+#
+# NOTE: All values of an empty slot are scalars, so an empty slot for slot_num
+#       may be formed by a shallow copy: dict(EMPTY_SLOT_DICT, slot=slot_num)
+#
+EMPTY_SLOT_DICT = json.loads(Template(EMPTY_JSON_SLOT_TEMPLATE).substitute(
+    { 'NO_COMMENT_VALUE': NO_COMMENT_VALUE,
+      'SLOT_VERSION_VALUE': SLOT_VERSION_VALUE,
+      'slot_num': '0' } ))
+
+# slot status strings set by this module
+#
+# NOTE: Each slot that is updated with one of these status values shares the one string object.
+#
+SLOT_STATUS_UPLOADED = "file successfully uploaded into slot."
+SLOT_STATUS_STAGED = "successfully moved submit file into the staging area"
+
+# sentinel returned by slot_dict.get(key, MISSING_SLOT_VALUE) when key is not in a slot dictionary
+#
+# NOTE: Unlike None, MISSING_SLOT_VALUE cannot be confused with a JSON null value.
+#
+MISSING_SLOT_VALUE = object()
+
 
 # username rules
 #
@@ -298,11 +374,66 @@ SHA1_HEXLEN = 40
 #
 SHA256_HEXLEN = 64
 
+# SHA256 hash as produced by hashlib hexdigest(): SHA256_HEXLEN lower case ASCII hex characters
+#
+SHA256_HEX_RE = f'^[0-9a-f]{{{SHA256_HEXLEN}}}$'
+SHA256_HEX_PATTERN = re.compile(SHA256_HEX_RE)
+
 # SHA256 buffer size
 #
-# Used by sha256_file(), and is selected to be about 20 4K memory pages.
+# Used by sha256_file_length(), and is selected to be 256 4K memory pages (1 MiB).
+# Larger blocks reduce the number of reads, and the per-block overhead, when
+# hashing large submit files.
 #
-SHA25_BUFSIZE= 20*4096
+SHA25_BUFSIZE= 256*4096
+
+# os.posix_fadvise() is not available on all platforms, such as macOS
+#
+HAVE_POSIX_FADVISE = hasattr(os, 'posix_fadvise')
+
+# SHA256 buffer pool
+#
+# sha256_file_length() reads into a SHA25_BUFSIZE buffer.  Rather than allocate a new buffer
+# for each file hashed, each thread keeps a memoryview of its own buffer as the mv attribute
+# of IOCCC_SHA256_POOL.
+#
+# NOTE: We do not use hashlib.file_digest() of Python 3.11 or later, as it hashes the file
+#       with a python readinto() loop of its own using a smaller 256 KiB buffer that is
+#       allocated for each file hashed.
+#
+IOCCC_SHA256_POOL = threading.local()
+
+# File stamps
+#
+# A file stamp is the (st_mtime_ns, st_ctime_ns, st_size, st_ino) of a file.  A cache of
+# information read from a file may be used while that file still has the same stamp.
+#
+# Because file timestamps have a coarse granularity, a file modified within the last
+# FILE_STAMP_SETTLE_SECS seconds could be modified again, even rewritten in place with
+# the same size, without changing its stamp.  We do not cache information read from
+# such a recently modified file.
+#
+FILE_STAMP_SETTLE_SECS = 2
+
+# SHA256 hashes of recently hashed files
+#
+# The ioccc_sha256_cache maps a (filename, st_mtime_ns, st_ctime_ns, st_size, st_ino) key
+# to the (hexdigest, length) that sha256_file_length() computed for that file.  While a file
+# still has the same key, sha256_file_length() returns the recorded hash without reading
+# the file.  The least recently used entries are dropped beyond SHA256_CACHE_MAX entries.
+#
+# Because file timestamps have a coarse granularity, a file modified within the last
+# SHA256_CACHE_SETTLE_SECS seconds could be modified again without changing its key.
+# We do not record the hash of such a recently modified file.
+#
+# The ioccc_sha256_cache_lock protects ioccc_sha256_cache from concurrent threads.
+#
+SHA256_CACHE_MAX = 4096
+SHA256_CACHE_SETTLE_SECS = 2
+# pylint: disable-next=invalid-name
+ioccc_sha256_cache = OrderedDict()
+# pylint: disable-next=invalid-name
+ioccc_sha256_cache_lock = threading.Lock()
 
 # slot numbers from 0 to MAX_SUBMIT_SLOT
 #
@@ -386,6 +517,102 @@ ioccc_last_errmsg = ""            # recent error message or empty string
 # pylint: disable-next=global-statement,invalid-name
 ioccc_pw_words = []
 
+# Slots known to be setup by this process
+#
+# The set holds (username, slot_num) tuples of slots that this process has already
+# initialized or verified.  When a slot is in this set, is_slot_setup() need not
+# re-stat the user directory, slot directory, slot JSON file and slot lock file.
+#
+# NOTE: This set is process local.  When the server restarts, each slot is verified again.
+#
+# pylint: disable-next=invalid-name
+ioccc_setup_slots = set()
+
+# Usernames found in the password file when it was last read
+#
+# When read_pwfile() loads the password file, it records the usernames found in
+# ioccc_known_usernames, along with the file stamp of the password file in
+# ioccc_known_usernames_stamp.  While the password file still has that same stamp,
+# a username not in ioccc_known_usernames is not in the password file.
+#
+# When the password file was recently modified, ioccc_known_usernames_stamp is None
+# and the ioccc_known_usernames are not trusted, see FILE_STAMP_SETTLE_SECS.
+# Functions in this module that write the password file forget these usernames.
+#
+# The ioccc_known_usernames dictionary maps each username to the user information
+# found in the password file.  While the password file still has that same stamp,
+# lookup_username() uses this user information instead of reading the password file.
+#
+# pylint: disable-next=global-statement,invalid-name
+ioccc_known_usernames = None      # dictionary of username to user information, or None
+# pylint: disable-next=global-statement,invalid-name
+ioccc_known_usernames_stamp = None    # password file stamp, or None
+
+# Contest dates found in the state file when it was last read
+#
+# When read_state() reads the state file, it records the file stamp of the state file,
+# and the open and close datetimes, in ioccc_state_cache.  While the state file still has
+# that same stamp, read_state() returns the recorded datetimes without locking, reading
+# and parsing the state file.  A recently modified state file is not remembered, see
+# FILE_STAMP_SETTLE_SECS.
+#
+# pylint: disable-next=global-statement,invalid-name
+ioccc_state_cache = None          # (stamp, open_datetime, close_datetime), or None
+
+# Contents of the initial state file
+#
+# The first time read_state() finds no state file, it reads the initial state file into
+# ioccc_init_state_bytes.  Should the state file go missing again, read_state() writes
+# these bytes into the state file without reading the initial state file again.
+#
+# pylint: disable-next=invalid-name
+ioccc_init_state_bytes = None     # bytes of INIT_STATE_FILE, or None
+
+# Secret key found in the secret file when it was last read
+#
+# When return_secret() reads a usable secret key from the secret file, it records the
+# path of the secret file, the file stamp of the secret file, and the secret key, in
+# ioccc_secret_cache.  While the secret file still has that same path and stamp,
+# return_secret() returns the recorded secret key without reading the secret file.
+# A recently modified secret file is not remembered, see FILE_STAMP_SETTLE_SECS.
+#
+# pylint: disable-next=invalid-name
+ioccc_secret_cache = None         # (path, stamp, secret_key), or None
+
+# JSON files recently read by read_json_file_nolock()
+#
+# The dictionary maps a JSON filename to a (stamp, python dictionary) tuple, where stamp
+# is the file stamp of the JSON file when it was read.  While the JSON file still has
+# that same stamp, read_json_file_nolock() returns a copy of the python dictionary without
+# opening and parsing the JSON file.  Functions in this module that write a JSON file
+# remove that JSON file from this dictionary.
+#
+# A recently modified JSON file is not remembered, see FILE_STAMP_SETTLE_SECS.  This matters
+# as other processes of the IOCCC submit server replace JSON files, and the inode number of
+# a replaced JSON file may be reused.
+#
+# NOTE: The slot and state JSON files hold only strings, numbers, booleans and null values,
+#       so a shallow copy of the python dictionary is sufficient.
+#
+# At most JSON_CACHE_MAX JSON files are remembered.  When a new JSON file would exceed
+# that limit, the least recently read JSON file is forgotten.
+#
+# The ioccc_json_cache_lock protects ioccc_json_cache from concurrent threads.
+#
+JSON_CACHE_MAX = 4096
+# pylint: disable-next=invalid-name
+ioccc_json_cache = OrderedDict()
+# pylint: disable-next=invalid-name
+ioccc_json_cache_lock = threading.Lock()
+
+# File creation mask
+#
+# Files and directories we create, such as user directories, slot directories,
+# slot JSON files and lock files, assume a umask of 0o022.  The umask is process
+# wide, so we set it once here instead of on every slot lock or slot read.
+#
+umask(0o022)
+
 # Lock parameters
 #
 LOCK_TIMEOUT = 13                           # lock timeout in seconds
@@ -402,6 +629,44 @@ LOCK_INTERVAL = random.uniform(0.8, 1.2)    # poll for lock at interval 0.8 <= s
 # pylint: disable-next=invalid-name
 ioccc_logger = None
 
+# IOCCC logger configuration
+#
+# The IOCCC_LOG_FORMATTER is the logging format used by all of our logging handlers.
+#
+# Logging handlers formed by setup_logger() are kept in ioccc_log_handlers, keyed by the
+# (logtype, logging_level) tuple, so that they may be reused by a later call to setup_logger().
+# The (logtype, logging_level) tuple that setup_logger() last configured is kept in
+# ioccc_logger_config, or None.
+#
+# The syslog address is determined once by return_syslog_address(), and kept in
+# ioccc_syslog_address, or None.
+#
+IOCCC_LOG_FORMATTER = logging.Formatter('%(asctime)s.%(msecs)03d: %(name)s: %(levelname)s: %(message)s',
+                                        datefmt='%Y-%m-%d %H:%M:%S')
+# The LOGTYPE_SET holds the logtype strings that setup_logger() accepts.
+#
+# The LOGGING_LEVEL_MAP maps a lower case dbglvl string to a logging level.
+# Any other dbglvl value is treated as logging.INFO.
+#
+LOGTYPE_SET = frozenset({'stdout', 'stderr', 'syslog', 'none'})
+LOGGING_LEVEL_MAP = {
+    'dbg': logging.DEBUG,
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warn': logging.WARNING,
+    'warning': logging.WARNING,
+    'err': logging.ERROR,
+    'error': logging.ERROR,
+    'crit': logging.CRITICAL,
+    'critical': logging.CRITICAL,
+}
+# pylint: disable-next=invalid-name
+ioccc_log_handlers = {}
+# pylint: disable-next=invalid-name
+ioccc_logger_config = None
+# pylint: disable-next=invalid-name
+ioccc_syslog_address = None
+
 
 def return_last_errmsg():
     """
@@ -428,6 +693,79 @@ def return_last_errmsg():
     return ioccc_last_errmsg
 
 
+def parse_datetime_usec(date_string):
+    """
+    Convert a date string in DATETIME_USEC_FORMAT format into a datetime object
+
+    This function returns the same value as:
+
+        datetime.datetime.strptime(date_string, DATETIME_USEC_FORMAT)
+
+    but for a canonical date string, uses datetime.datetime.fromisoformat()
+    which does not have to parse the format string on every call.
+
+    Given:
+        date_string     date string in DATETIME_USEC_FORMAT format
+
+    Returns:
+        datetime object (without a timezone)
+
+    Raises:
+        ValueError      date_string is not in DATETIME_USEC_FORMAT format
+
+    NOTE: Like strptime(), date_string must be a string.
+    """
+
+    # case: canonical date string - convert all but the trailing " UTC"
+    #
+    if DATETIME_USEC_RE.fullmatch(date_string):
+        return datetime.datetime.fromisoformat(date_string[:-4])
+
+    # otherwise let strptime() convert, or reject, the date string
+    #
+    return datetime.datetime.strptime(date_string, DATETIME_USEC_FORMAT)
+
+
+def return_file_stamp(file_stat):
+    """
+    Return the stamp of a file
+
+    Given:
+        file_stat       os.stat_result of the file
+
+    Returns:
+        (st_mtime_ns, st_ctime_ns, st_size, st_ino) tuple
+    """
+
+    return (file_stat.st_mtime_ns, file_stat.st_ctime_ns, file_stat.st_size, file_stat.st_ino)
+
+
+def return_settled_file_stamp(file_stat):
+    """
+    Return the stamp of a file that may be cached
+
+    A file modified or changed within the last FILE_STAMP_SETTLE_SECS seconds could
+    be modified again without changing its stamp, so information read from such a
+    file must not be cached.
+
+    Given:
+        file_stat       os.stat_result of the file
+
+    Returns:
+        None ==> file was recently modified or changed, do not cache
+        != None ==> (st_mtime_ns, st_ctime_ns, st_size, st_ino) tuple
+    """
+
+    # case: file was recently modified or changed
+    #
+    if time.time_ns() - max(file_stat.st_mtime_ns, file_stat.st_ctime_ns) <= FILE_STAMP_SETTLE_SECS * 1000000000:
+        return None
+
+    # return the stamp of the settled file
+    #
+    return return_file_stamp(file_stat)
+
+
 def return_client_ip() -> str:
     """
     Return the client IP address or ((UNKNOWN))
@@ -489,6 +827,8 @@ def return_client_ip() -> str:
     return ip
 
 
+# pylint: disable=too-many-statements
+#
 def change_startup_appdir(topdir):
     """
     Change the path to the app directory from the APPDIR default.
@@ -525,6 +865,11 @@ def change_startup_appdir(topdir):
     global PW_WORDS
     global STAGED_DIR
     global UNEXPECTED_DIR
+    global ioccc_known_usernames
+    global ioccc_known_usernames_stamp
+    global ioccc_state_cache
+    global ioccc_init_state_bytes
+    global ioccc_secret_cache
     # pylint: enable=global-statement
     me = inspect.currentframe().f_code.co_name
     debug(f'{me}: start')
@@ -570,10 +915,25 @@ def change_startup_appdir(topdir):
     #
     # pylint: enable=redefined-outer-name
 
+    # slots setup, and usernames known, under the previous app directory no longer apply
+    #
+    ioccc_setup_slots.clear()
+    ioccc_known_usernames = None
+    ioccc_known_usernames_stamp = None
+    ioccc_state_cache = None
+    ioccc_init_state_bytes = None
+    ioccc_secret_cache = None
+    with ioccc_json_cache_lock:
+        ioccc_json_cache.clear()
+    with ioccc_sha256_cache_lock:
+        ioccc_sha256_cache.clear()
+
     # assume all is well
     #
     debug(f'{me}: end')
     return True
+#
+# pylint: enable=too-many-statements
 
 
 def cd_appdir() -> None:
@@ -784,7 +1144,7 @@ def check_username_arg(username, parent):
     #
     # NOTE: In all other cases, failing this firewall is unexpected.
     #
-    if not re.match(POSIX_SAFE_RE, username):
+    if not POSIX_SAFE_PATTERN.match(username):
         ioccc_last_errmsg = f'ERROR: {me}: via {parent}: username arg not POSIX safe'
         # use info() instead of error() - cause may be a system cracked or testing.
         info(f'{me}: via {parent}: username arg not POSIX safe')
@@ -867,8 +1227,8 @@ def return_user_dir_path(username):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'return_user_dir_path'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -882,7 +1242,7 @@ def return_user_dir_path(username):
     # return user directory path
     #
     user_dir = f'{USERS_DIR}/{username}'
-    debug(f'{me}: end: returning user_dir: {user_dir}')
+    debug('%s: end: returning user_dir: %s', me, user_dir)
     return user_dir
 
 
@@ -911,8 +1271,8 @@ def return_slot_dir_path(username, slot_num):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'return_slot_dir_path'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -936,13 +1296,13 @@ def return_slot_dir_path(username, slot_num):
     #
     user_dir = return_user_dir_path(username)
     if not user_dir:
-        error(f'{me}: return_user_dir_path failed for username: {username}')
+        error('%s: return_user_dir_path failed for username: %s', me, username)
         return None
 
     # return slot directory path under a given user directory
     #
     slot_dir = f'{user_dir}/{slot_num}'
-    debug(f'{me}: end: returning slot_dir: {slot_dir}')
+    debug('%s: end: returning slot_dir: %s', me, slot_dir)
     return slot_dir
 #
 # pylint: enable=too-many-return-statements
@@ -971,8 +1331,8 @@ def return_slot_json_filename(username, slot_num):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'return_slot_json_filename'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -996,20 +1356,20 @@ def return_slot_json_filename(username, slot_num):
     #
     user_dir = return_user_dir_path(username)
     if not user_dir:
-        error(f'{me}: return_user_dir_path failed for username: {username}')
+        error('%s: return_user_dir_path failed for username: %s', me, username)
         return None
 
     # determine slot directory path
     #
     slot_dir = return_slot_dir_path(username, slot_num)
     if not slot_dir:
-        error(f'{me}: return_slot_dir_path failed for username: {username} slot_num: {slot_num}')
+        error('%s: return_slot_dir_path failed for username: %s slot_num: %s', me, username, slot_num)
         return None
 
     # determine the JSON filename for this given slot
     #
     slot_json_file = f'{slot_dir}/slot.json'
-    debug(f'{me}: end: returning slot_json_file: {slot_json_file}')
+    debug('%s: end: returning slot_json_file: %s', me, slot_json_file)
     return slot_json_file
 #
 # pylint: enable=too-many-return-statements
@@ -1110,8 +1470,8 @@ def return_submit_filename(slot_dict, username, slot_num):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'return_submit_filename'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -1139,19 +1499,19 @@ def return_submit_filename(slot_dict, username, slot_num):
     # obtain path of the submit filename
     #
     if not 'filename' in slot_dict:
-        error(f'{me}: submit filename missing from slot JSON file for username: {username} slot_num: {slot_num}')
+        error('%s: submit filename missing from slot JSON file for username: %s slot_num: %s', me, username, slot_num)
         return None
     if not slot_dict['filename']:
         # no submit file has ever been uploaded to this slot
         return None
     if not isinstance(slot_dict['filename'], str):
-        error(f'{me}: submit filename is not a string for username: {username} slot_num: {slot_num}')
+        error('%s: submit filename is not a string for username: %s slot_num: %s', me, username, slot_num)
         return None
 
     # return submit filename
     #
     submit_file = slot_dict["filename"]
-    debug(f'{me}: end: returning submit_file: {submit_file}')
+    debug('%s: end: returning submit_file: %s', me, submit_file)
     return submit_file
 #
 # pylint: enable=too-many-return-statements
@@ -1182,8 +1542,8 @@ def return_submit_path(slot_dict, username, slot_num):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'return_submit_path'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -1206,31 +1566,31 @@ def return_submit_path(slot_dict, username, slot_num):
     # validate args
     #
     if not isinstance(slot_dict, dict):
-        error(f'{me}: slot_dict arg is not a python dictionary')
+        error('%s: slot_dict arg is not a python dictionary', me)
 
     # determine JSON slot directory path
     #
     slot_dir = return_slot_dir_path(username, slot_num)
     if not slot_dir:
-        error(f'{me}: return_slot_dir_path failed for username: {username} slot_num: {slot_num}')
+        error('%s: return_slot_dir_path failed for username: %s slot_num: %s', me, username, slot_num)
         return None
 
     # obtain path of the submit filename
     #
     if not 'filename' in slot_dict:
-        error(f'{me}: submit filename missing from slot JSON file for username: {username} slot_num: {slot_num}')
+        error('%s: submit filename missing from slot JSON file for username: %s slot_num: %s', me, username, slot_num)
         return None
     if not slot_dict['filename']:
         # no submit file has ever been uploaded to this slot
         return None
     if not isinstance(slot_dict['filename'], str):
-        error(f'{me}: submit filename is not a string for username: {username} slot_num: {slot_num}')
+        error('%s: submit filename is not a string for username: %s slot_num: %s', me, username, slot_num)
         return None
 
     # return submit filename
     #
     submit_path = f'{slot_dir}/{slot_dict["filename"]}'
-    debug(f'{me}: end: returning submit_path: {submit_path}')
+    debug('%s: end: returning submit_path: %s', me, submit_path)
     return submit_path
 #
 # pylint: enable=too-many-return-statements
@@ -1439,8 +1799,11 @@ def read_pwfile():
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
+    global ioccc_known_usernames
+    global ioccc_known_usernames_stamp
+    # pylint: enable=global-statement
     me = inspect.currentframe().f_code.co_name
     debug(f'{me}: start')
 
@@ -1476,6 +1839,21 @@ def read_pwfile():
                 #
                 pw_dict = json.load(j_pw)
 
+                # note the usernames in the password file we just read
+                #
+                # NOTE: Like lookup_username(), we use the first entry found for a username.
+                #
+                # NOTE: We note a copy of each entry so that a caller that changes the
+                #       python dictionary we return cannot change our user information.
+                #
+                if isinstance(pw_dict, list):
+                    pw_stat = os.fstat(j_pw.fileno())
+                    ioccc_known_usernames = {}
+                    for i in pw_dict:
+                        if isinstance(i, dict) and 'username' in i and i['username'] not in ioccc_known_usernames:
+                            ioccc_known_usernames[i['username']] = i.copy()
+                    ioccc_known_usernames_stamp = return_settled_file_stamp(pw_stat)
+
                 # release the lock of the password file
                 #
                 lock_fd.release()
@@ -1548,8 +1926,11 @@ def copy_pwfile_under_lock(newfile):
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
+    global ioccc_known_usernames
+    global ioccc_known_usernames_stamp
+    # pylint: enable=global-statement
     me = inspect.currentframe().f_code.co_name
     debug(f'{me}: start')
 
@@ -1567,6 +1948,11 @@ def copy_pwfile_under_lock(newfile):
         error(f'{me}: failed to lock file for PW_LOCK: {PW_LOCK}')
         return False
 
+    # forget the usernames that read_pwfile() noted so that the password file is read again
+    #
+    ioccc_known_usernames = None
+    ioccc_known_usernames_stamp = None
+
     # copy the password file
     #
     try:
@@ -1601,8 +1987,11 @@ def replace_pwfile(pw_dict):
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
+    global ioccc_known_usernames
+    global ioccc_known_usernames_stamp
+    # pylint: enable=global-statement
     me = inspect.currentframe().f_code.co_name
     debug(f'{me}: start')
 
@@ -1613,11 +2002,16 @@ def replace_pwfile(pw_dict):
         error(f'{me}: failed to lock file for PW_LOCK: {PW_LOCK}')
         return False
 
+    # forget the usernames that read_pwfile() noted as we may be about to change the password file
+    #
+    ioccc_known_usernames = None
+    ioccc_known_usernames_stamp = None
+
     # rewrite the password file with the PW_FILE and unlock
     #
     try:
         with open(PW_FILE, mode="w", encoding="utf-8") as j_pw:
-            j_pw.write(json.dumps(pw_dict, ensure_ascii=True, indent=4))
+            j_pw.write(JSON_ENCODER.encode(pw_dict))
             j_pw.write('\n')
 
             # close and unlock the password file
@@ -1849,20 +2243,47 @@ def lookup_username(username):
         #
         return None
 
-    # load JSON from the password file as a python dictionary
+    # determine if the password file has changed since read_pwfile() last read it
     #
-    pw_dict = read_pwfile()
-    if not pw_dict:
-        error(f'{me}: read_pwfile failed')
-        return None
+    # NOTE: When the password file was recently modified, ioccc_known_usernames_stamp
+    #       is None and we must read the password file again.
+    #
+    pw_unchanged = False
+    if ioccc_known_usernames is not None and ioccc_known_usernames_stamp is not None:
+        try:
+            pw_stat = os.stat(PW_FILE)
+            pw_unchanged = return_file_stamp(pw_stat) == ioccc_known_usernames_stamp
+
+        # Do not use: except OSError as errcode: because read_pwfile() will report the error
+        #
+        except OSError:
+            pass
 
-    # search the password file for the user
+    # case: password file is unchanged, use the user information we already have
     #
-    user_dict = None
-    for i in pw_dict:
-        if 'username' in i and i['username'] == username:
-            user_dict = i
-            break
+    # NOTE: In both cases below we return a copy so that the caller cannot change
+    #       the user information that read_pwfile() saved in ioccc_known_usernames.
+    #
+    if pw_unchanged:
+        user_dict = ioccc_known_usernames.get(username)
+        if user_dict:
+            user_dict = user_dict.copy()
+
+    # case: load JSON from the password file as a python dictionary
+    #
+    else:
+        pw_dict = read_pwfile()
+        if not pw_dict:
+            error(f'{me}: read_pwfile failed')
+            return None
+
+        # search the password file for the user
+        #
+        user_dict = None
+        for i in pw_dict:
+            if 'username' in i and i['username'] == username:
+                user_dict = i.copy()
+                break
     if not user_dict:
         ioccc_last_errmsg = f'ERROR: {me}: unknown username: {username}'
         debug(f'{me}: failed to find in password file for username: {username}')
@@ -2027,8 +2448,11 @@ def update_username(username, pwhash, ignore_date, force_pw_change, pw_change_by
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
+    global ioccc_known_usernames
+    global ioccc_known_usernames_stamp
+    # pylint: enable=global-statement
     me = inspect.currentframe().f_code.co_name
     debug(f'{me}: start')
 
@@ -2105,7 +2529,7 @@ def update_username(username, pwhash, ignore_date, force_pw_change, pw_change_by
     # This also prevents username with /, and prevents it from being empty string,
     # thus one cannot create a username with system cracking "funny business".
     #
-    if not re.match(POSIX_SAFE_RE, username):
+    if not POSIX_SAFE_PATTERN.match(username):
         ioccc_last_errmsg = f'ERROR: {me}: username arg not POSIX safe'
         info(f'{me}: username arg not POSIX safe')
         return False
@@ -2117,6 +2541,11 @@ def update_username(username, pwhash, ignore_date, force_pw_change, pw_change_by
         error(f'{me}: failed to lock file for PW_LOCK: {PW_LOCK}')
         return False
 
+    # forget the usernames that read_pwfile() noted as we may be about to change the password file
+    #
+    ioccc_known_usernames = None
+    ioccc_known_usernames_stamp = None
+
     # If there is no password file, or if the password file is empty, copy it from the initial password file
     #
     if not os.path.isfile(PW_FILE) or os.path.getsize(PW_FILE) <= 0:
@@ -2194,7 +2623,7 @@ def update_username(username, pwhash, ignore_date, force_pw_change, pw_change_by
     #
     try:
         with open(PW_FILE, mode="w", encoding="utf-8") as j_pw:
-            j_pw.write(json.dumps(pw_dict, ensure_ascii=True, indent=4))
+            j_pw.write(JSON_ENCODER.encode(pw_dict))
             j_pw.write('\n')
 
             # close and unlock the password file
@@ -2256,8 +2685,11 @@ def delete_username(username):
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
+    global ioccc_known_usernames
+    global ioccc_known_usernames_stamp
+    # pylint: enable=global-statement
     me = inspect.currentframe().f_code.co_name
     debug(f'{me}: start')
 
@@ -2277,6 +2709,11 @@ def delete_username(username):
         error(f'{me}: failed to lock file for PW_LOCK: {PW_LOCK}')
         return None
 
+    # forget the usernames that read_pwfile() noted as we may be about to change the password file
+    #
+    ioccc_known_usernames = None
+    ioccc_known_usernames_stamp = None
+
     # If there is no password file, or if the password file is empty, copy it from the initial password file
     #
     if not os.path.isfile(PW_FILE) or os.path.getsize(PW_FILE) <= 0:
@@ -2344,7 +2781,7 @@ def delete_username(username):
     #
     try:
         with open(PW_FILE, mode="w", encoding="utf-8") as j_pw:
-            j_pw.write(json.dumps(new_pw_dict, ensure_ascii=True, indent=4))
+            j_pw.write(JSON_ENCODER.encode(new_pw_dict))
             j_pw.write('\n')
 
             # close and unlock the password file
@@ -2371,6 +2808,11 @@ def delete_username(username):
         ioccc_file_unlock()
         return None
 
+    # forget any slots of the deleted user that we setup
+    #
+    for slot_num in range(0, MAX_SUBMIT_SLOT+1):
+        ioccc_setup_slots.discard((username, slot_num))
+
     # return the user that was deleted, if they were found
     #
     debug(f'{me}: end: deleted username: {username}')
@@ -3374,7 +3816,7 @@ def user_expired_pw(user_dict):
         # Convert pw_change_by into a datetime string
         #
         try:
-            pw_change_by = datetime.datetime.strptime(user_dict['pw_change_by'], DATETIME_USEC_FORMAT)
+            pw_change_by = parse_datetime_usec(user_dict['pw_change_by'])
         except ValueError as errcode:
 
             # report pw_change_by time format is invalid
@@ -3383,7 +3825,7 @@ def user_expired_pw(user_dict):
             #       server to a web browser and thus we do not mention our function name.
             #
             ioccc_last_errmsg = "ERROR: username password change by date is invalid"
-            error(f'{me}: datetime.strptime of pw_change_by: <<{user_dict["pw_change_by"]}>>'
+            error(f'{me}: parse_datetime_usec of pw_change_by: <<{user_dict["pw_change_by"]}>>'
                   f'failed: <<{errcode}>>')
             return True
 
@@ -3552,6 +3994,30 @@ def username_login_allowed(username):
         ioccc_last_errmsg = "ERROR: username is not a proper username"
         return False
 
+    # fast reject - username was not in the password file when we last read it
+    #
+    # If the password file has not changed since read_pwfile() last read it, then
+    # a username that was not in the password file is still not in it, and we do not
+    # need to read and parse the password file again.
+    #
+    # NOTE: When the password file was recently modified, ioccc_known_usernames_stamp
+    #       is None and we must read the password file again.
+    #
+    if ioccc_known_usernames is not None and ioccc_known_usernames_stamp is not None and \
+       username not in ioccc_known_usernames:
+        try:
+            pw_stamp = return_file_stamp(os.stat(PW_FILE))
+        except OSError:
+            pw_stamp = None
+        if pw_stamp == ioccc_known_usernames_stamp:
+
+            # NOTE: We set ioccc_last_errmsg to a string suitable for display by the
+            #       server to a web browser and thus we do not mention our function name.
+            #
+            ioccc_last_errmsg = "ERROR: username is unknown"
+            debug(f'{me}: username not in unchanged password file: {username}')
+            return False
+
     # obtain the python dictionary for the username
     #
     # fail if user login is disabled or missing from the password file
@@ -3575,8 +4041,6 @@ def username_login_allowed(username):
     return allowed
 
 
-# pylint: disable=too-many-return-statements
-#
 def lock_slot(username, slot_num):
     """
     lock a slot for a user
@@ -3603,11 +4067,8 @@ def lock_slot(username, slot_num):
 
     # setup
     #
-    # pylint: disable-next=global-statement
-    global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
-    umask(0o022)
+    me = 'lock_slot'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -3627,58 +4088,97 @@ def lock_slot(username, slot_num):
         #
         return None
 
-    # determine user directory path
+    # lock the slot
     #
-    user_dir = return_user_dir_path(username)
-    if not user_dir:
-        error(f'{me}: return_user_dir_path failed for username: {username}')
-        return None
+    slot_lock_fd = lock_slot_nocheck(username, slot_num)
+    debug('%s: end', me)
+    return slot_lock_fd
 
-    # determine slot directory path
-    #
-    slot_dir = return_slot_dir_path(username, slot_num)
-    if not slot_dir:
-        error(f'{me}: return_slot_dir_path failed for username: {username} slot_num: {slot_num}')
-        return None
 
-    # be sure the user directory exists
-    #
-    try:
-        makedirs(user_dir, mode=0o2770, exist_ok=True)
-    except OSError as errcode:
-        ioccc_last_errmsg = f'ERROR: {me}: failed to create for username: {username} failed: <<{errcode}>>'
-        error(f'{me}: mkdir for username: {username} failed: <<{errcode}>>')
-        return None
+# pylint: disable=too-many-return-statements
+#
+def lock_slot_nocheck(username, slot_num):
+    """
+    lock a slot for a user, without the canonical firewall checks on the args
 
-    # be sure the slot directory exits
-    #
-    try:
-        makedirs(slot_dir, mode=0o2770, exist_ok=True)
+    This function is the same as lock_slot(username, slot_num) except that it
+    assumes that the caller has already performed the canonical firewall checks
+    on the username and slot_num args.
 
-    except OSError as errcode:
-        ioccc_last_errmsg = f'ERROR: {me}: failed to create slot: {slot_num} username: {username} failed: <<{errcode}>>'
-        error(f'{me}: slot directory mkdir for username: {username} slot_num: {slot_num} '
-              f'failed: <<{errcode}>>')
-        return None
+    Given:
+        username    IOCCC submit server username
+        slot_num    slot number for a given username
 
-    # determine the lock filename
-    #
-    slot_file_lock = f'{slot_dir}/lock'
+    Returns:
+        lock file descriptor    lock successful
+        None                    lock not successful
 
-    # lock the slot
-    #
-    slot_lock_fd = ioccc_file_lock(slot_file_lock)
+    WARNING: The caller must have already called check_username_arg(username, parent)
+             and check_slot_num_arg(slot_num) with success.
+    """
+
+    # setup
+    #
+    # pylint: disable-next=global-statement
+    global ioccc_last_errmsg
+    me = 'lock_slot_nocheck'
+    debug('%s: start', me)
+
+    # determine user directory path and slot directory path
+    #
+    # NOTE: The caller has already performed the canonical firewall checks on the username
+    #       and slot_num args, so we form these paths directly instead of calling
+    #       return_user_dir_path() and return_slot_dir_path() which repeat those checks.
+    #
+    user_dir = f'{USERS_DIR}/{username}'
+    slot_dir = f'{user_dir}/{slot_num}'
+
+    # be sure the slot directory, and the user directory above it, exists
+    #
+    # In the common case both directories already exist, so we try a single mkdir of
+    # the slot directory first.  Only when the user directory is missing do we create it.
+    #
+    # NOTE: We do not let makedirs(slot_dir) create the user directory because
+    #       makedirs() does not apply mode to intermediate directories.
+    #
+    try:
+        try:
+            os.mkdir(slot_dir, mode=0o2770)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            makedirs(user_dir, mode=0o2770, exist_ok=True)
+            makedirs(slot_dir, mode=0o2770, exist_ok=True)
+
+    except OSError as errcode:
+        if errcode.filename == user_dir:
+            ioccc_last_errmsg = f'ERROR: {me}: failed to create for username: {username} failed: <<{errcode}>>'
+            error('%s: mkdir for username: %s failed: <<%s>>', me, username, errcode)
+        else:
+            ioccc_last_errmsg = f'ERROR: {me}: failed to create slot: {slot_num} username: {username} ' \
+                                f'failed: <<{errcode}>>'
+            error('%s: slot directory mkdir for username: %s slot_num: %s failed: <<%s>>',
+                  me, username, slot_num, errcode)
+        return None
+
+    # determine the lock filename
+    #
+    slot_file_lock = f'{slot_dir}/lock'
+
+    # lock the slot
+    #
+    slot_lock_fd = ioccc_file_lock(slot_file_lock)
 
     # case: filed to lock
     #
     if not slot_lock_fd:
         ioccc_last_errmsg = f'ERROR: {me}: failed to lock: {slot_file_lock}'
-        error(f'{me}: failed to lock file for slot_file_lock: {slot_file_lock}')
+        error('%s: failed to lock file for slot_file_lock: %s', me, slot_file_lock)
         return None
 
     # return the slot lock success or None
     #
-    debug(f'{me}: end: slot locked for username: {username} slot_num: {slot_num}')
+    debug('%s: end: slot locked for username: %s slot_num: %s', me, username, slot_num)
     return slot_lock_fd
 #
 # pylint: enable=too-many-return-statements
@@ -3691,20 +4191,65 @@ def unlock_slot() -> None:
     A slot locked via lock_slot(username, slot_num) is unlocked
     using the last_slot_lock that noted the slot lock descriptor.
 
-    Returns:
-        True    slot unlock successful
-        False    failed to unlock slot
+    When no lock is held, this function does nothing.  In particular
+    it does not replace ioccc_last_errmsg, so an early error path may
+    call unlock_slot() without losing the error message it just set.
     """
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'unlock_slot'
+    debug('%s: start', me)
+
+    # case: no lock held, nothing to do
+    #
+    if not ioccc_last_lock_fd:
+        debug('%s: end: no lock held', me)
+        return
 
     # clear any previous lock
     #
     ioccc_file_unlock()
-    debug(f'{me}: end')
+    debug('%s: end', me)
+
+
+@contextmanager
+def slot_lock_nocheck(username, slot_num):
+    """
+    Lock a slot for the duration of a with block
+
+    The slot is locked via lock_slot_nocheck(username, slot_num) when the with block
+    is entered, and unlocked via unlock_slot() when the with block is left, including
+    when the with block is left by a return or by an exception:
+
+        with slot_lock_nocheck(username, slot_num) as slot_locked:
+            if not slot_locked:
+                return False
+            ...
+
+    Given:
+        username    IOCCC submit server username
+        slot_num    slot number for a given username
+
+    Yields:
+        True        the slot is locked
+        False       failed to lock the slot
+
+    WARNING: This function does NOT perform the canonical firewall checks on the username
+             and slot_num args.  The caller must have already checked them.
+    """
+
+    # lock the slot
+    #
+    slot_locked = bool(lock_slot_nocheck(username, slot_num))
+
+    # yield to the with block, and then unlock the slot
+    #
+    try:
+        yield slot_locked
+    finally:
+        if slot_locked:
+            unlock_slot()
 
 
 # pylint: disable=too-many-return-statements
@@ -3724,6 +4269,9 @@ def is_slot_setup(username, slot_num):
         False       user's slot has not been setup, or
                     user's slot needs to be rebuilt
 
+    NOTE: Once this process has setup or verified a slot, the slot is recorded
+          in ioccc_setup_slots and the filesystem is not checked again.
+
     WARNING: This function does NOT lock.  The caller should lock as needed.
     """
 
@@ -3732,7 +4280,7 @@ def is_slot_setup(username, slot_num):
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
     me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -3752,6 +4300,12 @@ def is_slot_setup(username, slot_num):
         #
         return False
 
+    # case: this process has already setup or verified the slot
+    #
+    if (username, slot_num) in ioccc_setup_slots:
+        debug('%s: end: slot already known to be setup', me)
+        return True
+
     #########################
     # user directory checks #
     #########################
@@ -3764,48 +4318,40 @@ def is_slot_setup(username, slot_num):
         ioccc_last_errmsg = f'ERROR: {me}: return_user_dir_path failed'
         return False
 
-    # user directory must exist
+    # user directory must exist and be a directory
+    #
+    # NOTE: We use a single os.stat() call instead of both Path().exists()
+    #       and Path().is_dir() as each of those would stat the path.
     #
     try:
-        if not Path(user_dir).exists():
-            # do not log errors, let the caller (re)initialize
-            ioccc_last_errmsg = f'Notice: {me}: user directory does not exist: {user_dir}'
-            return False
+        user_dir_stat = os.stat(user_dir)
 
     # Do not use: except OSError as errcode: because we have no easy way to report the errcode
     #
-    except OSError:
+    except (FileNotFoundError, NotADirectoryError):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: cannot determine if user directory exits: {user_dir}'
+        ioccc_last_errmsg = f'Notice: {me}: user directory does not exist: {user_dir}'
         return False
-
-    # user directory must be a directory
-    #
-    try:
-        if not Path(user_dir).is_dir():
-            # do not log errors, let the caller (re)initialize
-            ioccc_last_errmsg = f'Notice: {me}: user directory is not a directory: {user_dir}'
-            return False
-
-    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
-    #
     except OSError:
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: cannot determine if this is a user directory: {user_dir}'
+        ioccc_last_errmsg = f'Notice: {me}: cannot determine if user directory exits: {user_dir}'
         return False
-
-    # user directory must be readable
-    #
-    if not os.access(user_dir, os.R_OK):
+    if not stat.S_ISDIR(user_dir_stat.st_mode):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a readable user directory: {user_dir}'
+        ioccc_last_errmsg = f'Notice: {me}: user directory is not a directory: {user_dir}'
         return False
 
-    # user directory must be writable
+    # user directory must be readable and writable
+    #
+    # NOTE: We check both with a single os.access() call, and only on failure
+    #       do we check again to determine which access is missing.
     #
-    if not os.access(user_dir, os.W_OK):
+    if not os.access(user_dir, os.R_OK | os.W_OK):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a writable user directory: {user_dir}'
+        if not os.access(user_dir, os.R_OK):
+            ioccc_last_errmsg = f'Notice: {me}: not a readable user directory: {user_dir}'
+        else:
+            ioccc_last_errmsg = f'Notice: {me}: not a writable user directory: {user_dir}'
         return False
 
     #########################
@@ -3820,48 +4366,50 @@ def is_slot_setup(username, slot_num):
         ioccc_last_errmsg = f'ERROR: {me}: return_slot_dir_path failed'
         return False
 
-    # slot directory must exist
+    # slot directory must exist and be a directory
     #
     try:
-        if not Path(slot_dir).exists():
-            # do not log errors, let the caller (re)initialize
-            ioccc_last_errmsg = f'Notice: {me}: slot directory does not exist: {slot_dir}'
-            return False
+        slot_dir_stat = os.stat(slot_dir)
 
     # Do not use: except OSError as errcode: because we have no easy way to report the errcode
     #
+    except (FileNotFoundError, NotADirectoryError):
+        # do not log errors, let the caller (re)initialize
+        ioccc_last_errmsg = f'Notice: {me}: slot directory does not exist: {slot_dir}'
+        return False
     except OSError:
         # do not log errors, let the caller (re)initialize
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot directory exits: {slot_dir}'
         return False
-
-    # slot directory must be a directory
-    #
-    try:
-        if not Path(slot_dir).is_dir():
-            # do not log errors, let the caller (re)initialize
-            ioccc_last_errmsg = f'Notice: {me}: slot directory is not a directory: {slot_dir}'
-            return False
-
-    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
-    #
-    except OSError:
+    if not stat.S_ISDIR(slot_dir_stat.st_mode):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: cannot determine if this is a slot directory: {slot_dir}'
+        ioccc_last_errmsg = f'Notice: {me}: slot directory is not a directory: {slot_dir}'
         return False
 
-    # slot directory must be readable
+    # slot directory must be readable and writable
     #
-    if not os.access(slot_dir, os.R_OK):
+    if not os.access(slot_dir, os.R_OK | os.W_OK):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a readable slot directory: {slot_dir}'
+        if not os.access(slot_dir, os.R_OK):
+            ioccc_last_errmsg = f'Notice: {me}: not a readable slot directory: {slot_dir}'
+        else:
+            ioccc_last_errmsg = f'Notice: {me}: not a writable slot directory: {slot_dir}'
         return False
 
-    # slot directory must be writable
+    # scan the slot directory once
+    #
+    # Rather than stat each file in the slot directory by path, we scan the slot directory
+    # and use the directory entries to check the slot JSON file and slot lock file.
+    #
+    try:
+        with os.scandir(slot_dir) as slot_dir_iter:
+            slot_dir_entries = {entry.name: entry for entry in slot_dir_iter}
+
+    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
     #
-    if not os.access(slot_dir, os.W_OK):
+    except OSError:
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a writable slot directory: {slot_dir}'
+        ioccc_last_errmsg = f'Notice: {me}: cannot scan slot directory: {slot_dir}'
         return False
 
     #########################
@@ -3876,28 +4424,19 @@ def is_slot_setup(username, slot_num):
         ioccc_last_errmsg = f'ERROR: {me}: return_slot_json_filename failed'
         return False
 
-    # slot JSON file must exist
+    # slot JSON file must exist and be a file
     #
-    try:
-        if not Path(slot_json_file).exists():
-            # do not log errors, let the caller (re)initialize
-            ioccc_last_errmsg = f'Notice: {me}: slot JSON file does not exist: {slot_json_file}'
-            return False
-
-    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
-    #
-    except OSError:
+    slot_json_entry = slot_dir_entries.get(os.path.basename(slot_json_file))
+    if not slot_json_entry:
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot JSON file exits: {slot_json_file}'
+        ioccc_last_errmsg = f'Notice: {me}: slot JSON file does not exist: {slot_json_file}'
         return False
-
-    # slot JSON file must exist
-    #
     try:
-        if not Path(slot_json_file).is_file():
+        if not slot_json_entry.is_file():
             # do not log errors, let the caller (re)initialize
             ioccc_last_errmsg = f'Notice: {me}: slot JSON file is not a file: {slot_json_file}'
             return False
+        slot_json_stat = slot_json_entry.stat()
 
     # Do not use: except OSError as errcode: because we have no easy way to report the errcode
     #
@@ -3906,23 +4445,21 @@ def is_slot_setup(username, slot_num):
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if this is a slot JSON file: {slot_json_file}'
         return False
 
-    # slot JSON file must be readable
-    #
-    if not os.access(slot_json_file, os.R_OK):
-        # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a readable slot JSON file: {slot_json_file}'
-        return False
-
-    # slot JSON file must be writable
+    # slot JSON file must be readable and writable
     #
-    if not os.access(slot_json_file, os.W_OK):
+    if not os.access(slot_json_file, os.R_OK | os.W_OK):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a writable slot JSON file: {slot_json_file}'
+        if not os.access(slot_json_file, os.R_OK):
+            ioccc_last_errmsg = f'Notice: {me}: not a readable slot JSON file: {slot_json_file}'
+        else:
+            ioccc_last_errmsg = f'Notice: {me}: not a writable slot JSON file: {slot_json_file}'
         return False
 
     # slot JSON file must NOT be empty
     #
-    if os.path.getsize(slot_json_file) <= 0:
+    # NOTE: We use the size from the directory entry stat above instead of calling os.path.getsize().
+    #
+    if slot_json_stat.st_size <= 0:
         # do not log errors, let the caller (re)initialize
         ioccc_last_errmsg = f'Notice: {me}: empty slot JSON file: {slot_json_file}'
         return False
@@ -3939,25 +4476,15 @@ def is_slot_setup(username, slot_num):
         ioccc_last_errmsg = f'ERROR: {me}: return_slot_lockfile failed'
         return False
 
-    # slot lock file must exist
-    #
-    try:
-        if not Path(slot_lock_file).exists():
-            # do not log errors, let the caller (re)initialize
-            ioccc_last_errmsg = f'Notice: {me}: slot lock file does not exist: {slot_lock_file}'
-            return False
-
-    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+    # slot lock file must exist and be a file
     #
-    except OSError:
+    slot_lock_entry = slot_dir_entries.get(os.path.basename(slot_lock_file))
+    if not slot_lock_entry:
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot lock file exits: {slot_lock_file}'
+        ioccc_last_errmsg = f'Notice: {me}: slot lock file does not exist: {slot_lock_file}'
         return False
-
-    # slot lock file must exist
-    #
     try:
-        if not Path(slot_lock_file).is_file():
+        if not slot_lock_entry.is_file():
             # do not log errors, let the caller (re)initialize
             ioccc_last_errmsg = f'Notice: {me}: slot lock file is not a file: {slot_lock_file}'
             return False
@@ -3969,18 +4496,14 @@ def is_slot_setup(username, slot_num):
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if this is a slot lock file: {slot_lock_file}'
         return False
 
-    # slot lock file must be readable
+    # slot lock file must be readable and writable
     #
-    if not os.access(slot_lock_file, os.R_OK):
+    if not os.access(slot_lock_file, os.R_OK | os.W_OK):
         # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a readable slot lock file: {slot_lock_file}'
-        return False
-
-    # slot lock file must be writable
-    #
-    if not os.access(slot_lock_file, os.W_OK):
-        # do not log errors, let the caller (re)initialize
-        ioccc_last_errmsg = f'Notice: {me}: not a writable slot lock file: {slot_lock_file}'
+        if not os.access(slot_lock_file, os.R_OK):
+            ioccc_last_errmsg = f'Notice: {me}: not a readable slot lock file: {slot_lock_file}'
+        else:
+            ioccc_last_errmsg = f'Notice: {me}: not a writable slot lock file: {slot_lock_file}'
         return False
 
     ##########
@@ -3989,7 +4512,8 @@ def is_slot_setup(username, slot_num):
 
     # all is OK if we reach here
     #
-    debug(f'{me}: end: is_slot_setup is OK')
+    ioccc_setup_slots.add((username, slot_num))
+    debug('%s: end: is_slot_setup is OK', me)
     return True
 #
 # pylint: enable=too-many-return-statements
@@ -3997,13 +4521,87 @@ def is_slot_setup(username, slot_num):
 # pylint: enable=too-many-statements
 
 
-def write_slot_json_nolock(slot_json_file, slot_json):
+def write_json_file_nolock(json_file, json_dict, fsync_file=True):
+    """
+    Write a python dictionary into a JSON file, replacing the JSON file in one step
+
+    We write the JSON into a temporary file in the same directory as the JSON file and
+    then rename the temporary file onto the JSON file.  Thus, a reader of the JSON file
+    will see either the previous or the new contents, never an empty or partially written file.
+
+    Given:
+        json_file       JSON file to write
+        json_dict       content for the JSON file as a python dictionary
+        fsync_file      True ==> wait for the JSON file to reach storage (the default)
+                        False ==> do not wait, for JSON files that may be formed again if lost
+
+    Returns:
+        True    JSON file updated
+        False   failed to update JSON file
+
+    WARNING: This function does NOT lock.  The caller should lock as needed.
+    """
+
+    # setup
+    #
+    # pylint: disable-next=global-statement
+    global ioccc_last_errmsg
+    me = 'write_json_file_nolock'
+    debug('%s: start', me)
+
+    # When fsync_file is True, we open the temporary file with O_DSYNC so that our single
+    # write of the JSON returns only after the data has reached storage.  This way
+    # we do not need a separate fsync before we rename the temporary file.
+    #
+    tmp_json_file = f'{json_file}.tmp.{os.getpid()}'
+    tmp_json_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if fsync_file:
+        tmp_json_flags |= os.O_DSYNC
+    try:
+        json_fd = os.open(tmp_json_file, tmp_json_flags, 0o664)
+        with os.fdopen(json_fd, mode="w", encoding="utf-8") as json_fp:
+            json_fp.write(JSON_ENCODER.encode(json_dict) + '\n')
+
+        # replace the JSON file
+        #
+        os.replace(tmp_json_file, json_file)
+        with ioccc_json_cache_lock:
+            ioccc_json_cache.pop(json_file, None)
+
+        # flush the rename to storage
+        #
+        if fsync_file:
+            dir_fd = os.open(os.path.dirname(json_file) or '.', os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    except OSError as errcode:
+        ioccc_last_errmsg = f'ERROR: {me}: failed to write out JSON file: {json_file} failed: <<{errcode}>>'
+        error('%s: write and rename of %s to json_file: %s failed: <<%s>>', me, tmp_json_file, json_file, errcode)
+
+        # do not leave a partial temporary file behind
+        #
+        try:
+            os.remove(tmp_json_file)
+        except OSError:
+            pass
+        return False
+
+    debug('%s: end: updated json_file: %s', me, json_file)
+    return True
+
+
+def write_slot_json_nolock(slot_json_file, slot_json, fsync_file=True):
     """
     Write out an index of slots for the user.
 
     Given:
         slot_json_file     JSON filename for a given slot
         slot_json          content for a given slot as a python dictionary
+        fsync_file         True ==> wait for the slot JSON to reach storage (the default)
+                           False ==> do not wait, for slots that may be formed again if lost
 
     Returns:
         True    slot JSON file updated
@@ -4016,51 +4614,30 @@ def write_slot_json_nolock(slot_json_file, slot_json):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'write_slot_json_nolock'
+    debug('%s: start', me)
 
     # firewall - username arg must be a string
     #
     if not isinstance(slot_json_file, str):
         ioccc_last_errmsg = f'ERROR: {me}: slot_json_file arg is not a string'
-        error(f'{me}: slot_json_file arg is not a string')
-        return None
+        error('%s: slot_json_file arg is not a string', me)
+        return False
 
     # validate args
     #
     if not isinstance(slot_json, dict):
         ioccc_last_errmsg = f'ERROR: {me}: slot_json arg is not a python dictionary'
-        error(f'{me}: end: slot_json arg is not a python dictionary')
+        error('%s: end: slot_json arg is not a python dictionary', me)
         return False
 
     # write JSON file for slot
     #
-    try:
-        with open(slot_json_file, mode="w", encoding="utf-8") as slot_file_fp:
-            slot_file_fp.write(json.dumps(slot_json, ensure_ascii=True, indent=4))
-            slot_file_fp.write('\n')
-
-            # close slot file
-            #
-            # NOTE: We explicitly manage the close because we just did a write
-            #       and we want to catch the case where a write buffer may have
-            #       not been fully flushed to the file.
-            #
-            try:
-                slot_file_fp.close()
-
-            except OSError as errcode:
-                ioccc_last_errmsg = f'ERROR: {me}: failed to close: {slot_json_file} failed: <<{errcode}>>'
-                error(f'{me}: close writing for slot_json_file: {slot_json_file} '
-                      f'failed: <<{errcode}>>')
-                return False
-
-    except OSError as errcode:
-        ioccc_last_errmsg = f'ERROR: failed to write out slot file: {slot_json_file} failed: <<{errcode}>>'
-        error(f'{me}: open for slot_json_file: {slot_json_file} failed: <<{errcode}>>')
+    if not write_json_file_nolock(slot_json_file, slot_json, fsync_file):
+        error('%s: write_json_file_nolock failed for slot_json_file: %s', me, slot_json_file)
         return False
 
-    debug(f'{me}: end: updated slot_json_file: {slot_json_file}')
+    debug('%s: end: updated slot_json_file: %s', me, slot_json_file)
     return True
 
 
@@ -4088,7 +4665,7 @@ def initialize_slot_nolock(username, slot_num):
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
     me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -4117,7 +4694,7 @@ def initialize_slot_nolock(username, slot_num):
     user_dir = return_user_dir_path(username)
     if not user_dir:
         ioccc_last_errmsg = f'ERROR: {me}: return_user_dir_path failed'
-        error(f'{me}: return_user_dir_path failed')
+        error('%s: return_user_dir_path failed', me)
         return False
 
     # create user directory if needed
@@ -4131,14 +4708,13 @@ def initialize_slot_nolock(username, slot_num):
                 makedirs(user_dir, mode=0o2770, exist_ok=True)
             except OSError as errcode:
                 ioccc_last_errmsg = f'ERROR: {me}: failed to create for username: {username} failed: <<{errcode}>>'
-                error(f'{me}: mkdir for username: {username} failed: <<{errcode}>>')
+                error('%s: mkdir for username: %s failed: <<%s>>', me, username, errcode)
                 return False
 
     except OSError as errcode:
         ioccc_last_errmsg = (f'Notice: {me}: cannot determine if this is a user '
                              f'directory: {user_dir} failed: <<{errcode}>>')
-        error(f'{me}: cannot determine if this is a user '
-              f'directory: {user_dir} failed: <<{errcode}>>')
+        error('%s: cannot determine if this is a user directory: %s failed: <<%s>>', me, user_dir, errcode)
         return False
 
     # ensure that the user directory is read/write
@@ -4148,7 +4724,7 @@ def initialize_slot_nolock(username, slot_num):
             os.chmod(user_dir, mode=0o2770)
         except OSError as errcode:
             ioccc_last_errmsg = f'ERROR: {me}: failed to chmod 2770 {username} failed: <<{errcode}>>'
-            error(f'{me}: failed to chmod 2770 {username} failed: <<{errcode}>>')
+            error('%s: failed to chmod 2770 %s failed: <<%s>>', me, username, errcode)
             return False
 
     # firewall - user directory must be a read/write directory
@@ -4157,12 +4733,12 @@ def initialize_slot_nolock(username, slot_num):
         if not Path(user_dir).exists() or not Path(user_dir).is_dir() or \
            not os.access(user_dir, os.R_OK) or not os.access(user_dir, os.W_OK):
             ioccc_last_errmsg = f'ERROR: {me}: user directory was not setup correctly'
-            error(f'{me}: user directory was not setup correctly')
+            error('%s: user directory was not setup correctly', me)
             return False
 
     except OSError as errcode:
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if user directory is a read/write directory: {user_dir}'
-        error(f'{me}: cannot determine if user directory is a read/write directory: {user_dir}')
+        error('%s: cannot determine if user directory is a read/write directory: %s', me, user_dir)
         return False
 
     ########################
@@ -4174,7 +4750,7 @@ def initialize_slot_nolock(username, slot_num):
     slot_dir = return_slot_dir_path(username, slot_num)
     if not slot_dir:
         ioccc_last_errmsg = f'ERROR: {me}: return_slot_dir_path failed'
-        error(f'{me}: return_slot_dir_path failed')
+        error('%s: return_slot_dir_path failed', me)
         return False
 
     # create slot directory if needed
@@ -4188,12 +4764,12 @@ def initialize_slot_nolock(username, slot_num):
                 makedirs(slot_dir, mode=0o2770, exist_ok=True)
             except OSError as errcode:
                 ioccc_last_errmsg = f'ERROR: {me}: failed to create for username: {username} failed: <<{errcode}>>'
-                error(f'{me}: mkdir for username: {username} failed: <<{errcode}>>')
+                error('%s: mkdir for username: %s failed: <<%s>>', me, username, errcode)
                 return False
 
     except OSError as errcode:
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot directory exists: {slot_dir}'
-        error(f'{me}:  cannot determine if slot directory exists: {slot_dir}')
+        error('%s:  cannot determine if slot directory exists: %s', me, slot_dir)
         return False
 
     # ensure that the slot directory is read/write
@@ -4203,7 +4779,7 @@ def initialize_slot_nolock(username, slot_num):
             os.chmod(slot_dir, mode=0o2770)
         except OSError as errcode:
             ioccc_last_errmsg = f'ERROR: {me}: failed to chmod 2770 {username} failed: <<{errcode}>>'
-            error(f'{me}: failed to chmod 2770 {username} failed: <<{errcode}>>')
+            error('%s: failed to chmod 2770 %s failed: <<%s>>', me, username, errcode)
             return False
 
     # firewall - slot directory must be a read/write directory
@@ -4212,12 +4788,12 @@ def initialize_slot_nolock(username, slot_num):
         if not Path(slot_dir).exists() or not Path(slot_dir).is_dir() or \
            not os.access(slot_dir, os.R_OK) or not os.access(slot_dir, os.W_OK):
             ioccc_last_errmsg = f'ERROR: {me}: slot directory was not setup correctly'
-            error(f'{me}: slot directory was not setup correctly')
+            error('%s: slot directory was not setup correctly', me)
             return False
 
     except OSError as errcode:
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot directory is a read/write directory: {slot_dir}'
-        error(f'{me}: cannot determine if slot directory is a read/write directory: {slot_dir}')
+        error('%s: cannot determine if slot directory is a read/write directory: %s', me, slot_dir)
         return False
 
     ########################
@@ -4229,44 +4805,17 @@ def initialize_slot_nolock(username, slot_num):
     slot_json_file = return_slot_json_filename(username, slot_num)
     if not slot_json_file:
         ioccc_last_errmsg = f'ERROR: {me}: return_slot_json_filename failed'
-        error(f'{me}: return_slot_json_filename failed')
+        error('%s: return_slot_json_filename failed', me)
         return False
 
-    # setup the JSON slot using the template
-    #
-    t = Template(EMPTY_JSON_SLOT_TEMPLATE)
-
-    # initialize the slot JSON from the template
+    # initialize the slot JSON from the empty slot
     #
-    slot_json = json.loads(t.substitute( { 'NO_COMMENT_VALUE': NO_COMMENT_VALUE,
-                                           'SLOT_VERSION_VALUE': SLOT_VERSION_VALUE,
-                                           'slot_num': str(slot_num) } ))
+    slot_json = dict(EMPTY_SLOT_DICT, slot=slot_num)
 
     # write JSON file for slot
     #
-    try:
-        with open(slot_json_file, mode="w", encoding="utf-8") as slot_file_fp:
-            slot_file_fp.write(json.dumps(slot_json, ensure_ascii=True, indent=4))
-            slot_file_fp.write('\n')
-
-            # close slot file
-            #
-            # NOTE: We explicitly manage the close because we just did a write
-            #       and we want to catch the case where a write buffer may have
-            #       not been fully flushed to the file.
-            #
-            try:
-                slot_file_fp.close()
-
-            except OSError as errcode:
-                ioccc_last_errmsg = f'ERROR: {me}: failed to close: {slot_json_file} failed: <<{errcode}>>'
-                error(f'{me}: close writing for slot_json_file: {slot_json_file} '
-                      f'failed: <<{errcode}>>')
-                return False
-
-    except OSError as errcode:
-        ioccc_last_errmsg = f'ERROR: failed to write out slot file: {slot_json_file} failed: <<{errcode}>>'
-        error(f'{me}: open for slot_json_file: {slot_json_file} failed: <<{errcode}>>')
+    if not write_slot_json_nolock(slot_json_file, slot_json):
+        error('%s: write_slot_json_nolock failed for slot_json_file: %s', me, slot_json_file)
         return False
 
     # firewall - slot.json must be a non-empty read/write file
@@ -4276,12 +4825,12 @@ def initialize_slot_nolock(username, slot_num):
            not os.access(slot_json_file, os.R_OK) or not os.access(slot_json_file, os.W_OK) or \
            os.path.getsize(slot_json_file) <= 0:
             ioccc_last_errmsg = f'ERROR: {me}: slot.json file was not setup correctly: {slot_json_file}'
-            error(f'{me}: slot.json file was not setup correctly: {slot_json_file}')
+            error('%s: slot.json file was not setup correctly: %s', me, slot_json_file)
             return False
 
     except OSError as errcode:
         ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot.json file is read/write: {slot_json_file}'
-        error(f'{me}: cannot determine if slot.json file is read/write: {slot_json_file}')
+        error('%s: cannot determine if slot.json file is read/write: %s', me, slot_json_file)
         return False
 
     ########################
@@ -4293,40 +4842,32 @@ def initialize_slot_nolock(username, slot_num):
     slot_lock_file = return_slot_lockfile(username, slot_num)
     if not slot_lock_file:
         ioccc_last_errmsg = f'ERROR: {me}: return_slot_lockfile failed'
-        error(f'{me}: return_slot_lockfile failed')
+        error('%s: return_slot_lockfile failed', me)
         return False
 
-    # be sure the lock file exists
+    # be sure the lock file exists and is a read/write file
+    #
+    # NOTE: Opening the lock file for reading and writing, creating it if needed,
+    #       both creates the lock file and verifies that it is a read/write file.
+    #       A directory, or a file we cannot read or write, will fail to open.
     #
     try:
-        Path(slot_lock_file).touch(mode=0o664, exist_ok=True)
+        slot_lock_fd = os.open(slot_lock_file, os.O_RDWR | os.O_CREAT, 0o664)
+        os.close(slot_lock_fd)
 
     except OSError as errcode:
         ioccc_last_errmsg = (
-            f'ERROR: {me}: failed touch (mode=0o664, exist_ok=True): '
+            f'ERROR: {me}: slot lock file was not setup correctly: '
             f'{slot_lock_file} failed: <<{errcode}>>')
-        error(f'{me}: touch file_lock: {slot_lock_file} failed: <<{errcode}>>')
-        return None
-
-    # firewall - slot lock must be a read/write file
-    #
-    try:
-        if not Path(slot_lock_file).exists() or not Path(slot_lock_file).is_file() or \
-           not os.access(slot_lock_file, os.R_OK) or not os.access(slot_lock_file, os.W_OK):
-            ioccc_last_errmsg = f'ERROR: {me}: slot lock file file was not setup correctly: {slot_lock_file}'
-            error(f'{me}: slot lock file was not setup correctly: {slot_lock_file}')
-            return False
-
-    except OSError as errcode:
-        ioccc_last_errmsg = f'Notice: {me}: cannot determine if slot lock file is read/write: {slot_lock_file}'
-        error(f'{me}: cannot determine if slot lock file is read/write: {slot_lock_file}')
+        error('%s: open for create file_lock: %s failed: <<%s>>', me, slot_lock_file, errcode)
         return False
 
     ##########
     # all OK #
     ##########
 
-    debug(f'{me}: end: initialized username: {username} slot_num: {slot_num}')
+    ioccc_setup_slots.add((username, slot_num))
+    debug('%s: end: initialized username: %s slot_num: %s', me, username, slot_num)
     return True
 #
 # pylint: enable=too-many-return-statements
@@ -4334,154 +4875,258 @@ def initialize_slot_nolock(username, slot_num):
 # pylint: enable=too-many-statements
 
 
-# pylint: disable=too-many-statements
-# pylint: disable=too-many-branches
-# pylint: disable=too-many-return-statements
-#
-def initialize_user_tree(username):
+def resolve_user(username, parent):
     """
-    Initialize the directory tree for a given user
-
-    We create the directory for the username if the directory does not exist.
-    We create the slot for the username if the slot directory does not exist.
-    We create the lock file for the slot it the lock file does not exist.
-    We initialize the slot JSON file it the slot JSON file does not exist.
-
-    NOTE: Because this may be called early, we cannot use HTML or other
-          error carping delivery.  We only set last_excpt are return None.
+    Resolve a username into the user directory path and user information
 
     Given:
         username    IOCCC submit server username
+        parent      name of the calling function
 
     Returns:
-        None ==> invalid slot number or invalid user directory
-        != None ==> array of slot user data as a python dictionary
+        None ==> username is not POSIX safe, or
+                 no such username
+        != None ==> (user_dir, user_dict) tuple where:
+                        user_dir is the user directory path (which may not yet exist)
+                        user_dict is user information as a python dictionary
 
     NOTE: This function performs various canonical firewall checks on the username arg.
+
+    NOTE: Once a username has been resolved by this function, the caller may pass
+          the user directory path to functions such as initialize_user_tree_nocheck()
+          that do not repeat the username firewall checks.
     """
 
     # setup
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'resolve_user'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
-    if not check_username_arg(username, me):
+    if not check_username_arg(username, parent):
 
         # The check_username_arg() function above will set ioccc_last_errmsg
         # and issue log messages due to a username firewall check failure.
         #
         return None
 
-    # setup
+    # must be a valid user
     #
-    if not lookup_username(username):
+    user_dict = lookup_username(username)
+    if not user_dict:
         #
         # NOTE: We set ioccc_last_errmsg to a string suitable for display by the
         #       server to a web browser and thus we do not mention our function name.
         #
         ioccc_last_errmsg = "ERROR: no such username"
-        debug(f'{me}: lookup_username failed for username: {username}')
-        return None
-    user_dir = return_user_dir_path(username)
-    if not user_dir:
-        debug(f'{me}: return_user_dir_path failed for username: {username}')
+        debug('%s: lookup_username failed for username: %s', me, username)
         return None
-    umask(0o022)
 
-    # be sure the user directory exists
+    # return user directory path and user information
     #
-    try:
-        if not Path(user_dir).is_dir():
-            info(f'{me}: about to initialize user directory tree for username: {username}')
-        try:
-            makedirs(user_dir, mode=0o2770, exist_ok=True)
-        except OSError as errcode:
-            ioccc_last_errmsg = (f'ERROR: {me}: cannot form user directory for '
-                                 f'username: {username} failed: <<{errcode}>>')
-            return None
-
-    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+    # NOTE: We have already performed the firewall checks on the username arg that
+    #       return_user_dir_path() would perform.
     #
-    except OSError:
-        ioccc_last_errmsg = f'ERROR: {me}: cannot deterime if user directory is a directory: {user_dir}'
-        return None
+    user_dir = f'{USERS_DIR}/{username}'
+    debug('%s: end: resolved username: %s user_dir: %s', me, username, user_dir)
+    return user_dir, user_dict
 
-    # process each slot for this user
-    #
-    slots = [None] * (MAX_SUBMIT_SLOT+1)
-    for slot_num in range(0, MAX_SUBMIT_SLOT+1):
 
-        # determine the slot directory
-        #
-        slot_dir = return_slot_dir_path(username, slot_num)
-        if not slot_dir:
-            error(f'{me}: return_slot_dir_path failed for username: {username} slot_num: {slot_num}')
-            return None
+def initialize_user_tree(username):
+    """
+    Initialize the directory tree for a given user
 
-        # be sure the slot directory exits
+    NOTE: Because this may be called early, we cannot use HTML or other
+          error carping delivery.  We only set last_excpt are return None.
+
+    Given:
+        username    IOCCC submit server username
+
+    Returns:
+        None ==> invalid slot number or invalid user directory
+        != None ==> array of slot user data as a python dictionary
+
+    NOTE: This function performs various canonical firewall checks on the username arg.
+
+    See initialize_user_tree_nocheck() for details.
+    """
+
+    # setup
+    #
+    me = 'initialize_user_tree'
+    debug('%s: start', me)
+
+    # firewall - resolve the username into the user directory path
+    #
+    resolved = resolve_user(username, me)
+    if not resolved:
+
+        # The resolve_user() function above will set ioccc_last_errmsg
+        # and issue log messages due to a username check failure.
         #
+        return None
+    user_dir = resolved[0]
+
+    # initialize the directory tree for the user
+    #
+    slots = initialize_user_tree_nocheck(username, user_dir)
+    debug('%s: end: initialize_user_tree_nocheck returned for username: %s', me, username)
+    return slots
+
+
+# pylint: disable=too-many-statements
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-return-statements
+#
+def initialize_user_tree_nocheck(username, user_dir):
+    """
+    Initialize the directory tree for a given user that has already been resolved
+
+    We create the directory for the username if the directory does not exist.
+    We create the slot for the username if the slot directory does not exist.
+    We create the lock file for the slot it the lock file does not exist.
+    We initialize the slot JSON file it the slot JSON file does not exist.
+
+    NOTE: Because this may be called early, we cannot use HTML or other
+          error carping delivery.  We only set last_excpt are return None.
+
+    Given:
+        username    IOCCC submit server username
+        user_dir    user directory path as returned by resolve_user()
+
+    Returns:
+        None ==> invalid user directory or slot
+        != None ==> array of slot user data as a python dictionary
+
+    WARNING: This function does NOT perform the canonical firewall checks on the username arg.
+             The caller must have obtained user_dir from resolve_user().
+    """
+
+    # setup
+    #
+    # pylint: disable-next=global-statement
+    global ioccc_last_errmsg
+    me = 'initialize_user_tree_nocheck'
+    debug('%s: start', me)
+
+    # determine if the user directory tree is already setup
+    #
+    # When every slot is already setup, as is the case for all but the first login of
+    # a user, we do not need to form the user and slot directories.  We only need to
+    # read the slot JSON files.
+    #
+    tree_is_setup = all(is_slot_setup(username, slot_num) for slot_num in range(0, MAX_SUBMIT_SLOT+1))
+
+    # be sure the user directory exists
+    #
+    if not tree_is_setup:
         try:
-            makedirs(slot_dir, mode=0o2770, exist_ok=True)
-        except OSError as errcode:
-            ioccc_last_errmsg = f'ERROR: {me}: cannot form slot directory: {slot_dir} failed: <<{errcode}>>'
-            error(f'{me}: make directory for slot_dir: {slot_dir} '
-                  f'failed: <<{errcode}>>')
+            if not Path(user_dir).is_dir():
+                info('%s: about to initialize user directory tree for username: %s', me, username)
+            try:
+                makedirs(user_dir, mode=0o2770, exist_ok=True)
+            except OSError as errcode:
+                ioccc_last_errmsg = (f'ERROR: {me}: cannot form user directory for '
+                                     f'username: {username} failed: <<{errcode}>>')
+                return None
+
+        # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+        #
+        except OSError:
+            ioccc_last_errmsg = f'ERROR: {me}: cannot deterime if user directory is a directory: {user_dir}'
             return None
 
+    # process each slot for this user
+    #
+    slots = [None] * (MAX_SUBMIT_SLOT+1)
+    for slot_num in range(0, MAX_SUBMIT_SLOT+1):
+
+        # determine the slot directory
+        #
+        slot_dir = f'{user_dir}/{slot_num}'
+
+        # be sure the slot directory exits
+        #
+        if not tree_is_setup:
+            try:
+                makedirs(slot_dir, mode=0o2770, exist_ok=True)
+            except OSError as errcode:
+                ioccc_last_errmsg = f'ERROR: {me}: cannot form slot directory: {slot_dir} failed: <<{errcode}>>'
+                error('%s: make directory for slot_dir: %s failed: <<%s>>', me, slot_dir, errcode)
+                return None
+
         # Lock the slot
         #
         # This will create the lock file if needed.
         #
-        slot_lock_fd = lock_slot(username, slot_num)
+        slot_lock_fd = lock_slot_nocheck(username, slot_num)
         if not slot_lock_fd:
-            error(f'{me}: lock_slot failed for username: {username} slot_num: {slot_num}')
+            error('%s: lock_slot failed for username: %s slot_num: %s', me, username, slot_num)
             return None
 
         # read the JSON file for the user's slot
         #
         # NOTE: We initialize the slot JSON file if the JSON file does not exist.
         #
-        slot_json_file = return_slot_json_filename(username, slot_num)
-        if not slot_json_file:
-            error(f'{me}: return_slot_json_filename failed for username: {username} slot_num: {slot_num}')
-            unlock_slot()
-            return None
+        slot_json_file = f'{slot_dir}/slot.json'
+
+        # read the slot JSON file, if it exists
+        #
         try:
-            with open(slot_json_file, "r", encoding="utf-8") as slot_file_fp:
+            with open(slot_json_file, "rb") as slot_file_fp:
+                slot_json_bytes = slot_file_fp.read()
 
-                # obtain slot JSON file as a python dictionary
-                #
-                slots[slot_num] = json.load(slot_file_fp)
+        # case: no slot JSON file, so the slot JSON file is initialized below
+        #
+        except FileNotFoundError:
+            slot_json_bytes = None
 
-                # validate slot JSON file as a python dictionary
-                #
-                # NOTE: This call to validate_slot_dict_nolock(), if does NOT return an error
-                #       indicates we can expect the python dictionary for the slot to have
-                #       values that may be freely tested in this function below.
-                #
-                err_msg = validate_slot_dict_nolock(slots[slot_num], username, slot_num)
-                if isinstance(err_msg, str):
-                    error(f'{me}: {err_msg} for: username: {username} slot_num: {slot_num}')
-                    unlock_slot()
-                    return None
+        # case: the slot JSON file exists but cannot be read
+        #
+        # NOTE: We must not replace a slot JSON file that we cannot read with an empty slot,
+        #       as it may record a submit file that was uploaded into the slot.
+        #
+        except OSError as errcode:
+            ioccc_last_errmsg = f'ERROR: {me}: cannot read slot JSON file: {slot_json_file} failed: <<{errcode}>>'
+            error('%s: read of slot_json_file: %s failed: <<%s>>', me, slot_json_file, errcode)
+            unlock_slot()
+            return None
 
-        except OSError:
-            debug(f'{me}: forming new slot file for username: {username} slot_num: {slot_num} '
-                  f'slot_json_file: {slot_json_file}')
+        # case: the slot JSON file exists but is empty
+        #
+        # NOTE: We must not replace an empty slot JSON file with an empty slot, as we
+        #       cannot tell what the slot held.  The empty slot JSON file is left in place.
+        #
+        if slot_json_bytes is not None and not slot_json_bytes:
+            ioccc_last_errmsg = f'ERROR: {me}: empty slot JSON file: {slot_json_file}'
+            error('%s: empty slot_json_file: %s', me, slot_json_file)
+            unlock_slot()
+            return None
 
-            # setup the JSON slot using the template
+        # case: we have a slot JSON file
+        #
+        if slot_json_bytes is not None:
+
+            # obtain slot JSON file as a python dictionary
+            #
+            # NOTE: We parse the raw bytes of the slot JSON file rather than
+            #       first decoding them into a string.
             #
-            t = Template(EMPTY_JSON_SLOT_TEMPLATE)
+            try:
+                slots[slot_num] = json_loads(slot_json_bytes)
 
-            # initialize the slot JSON from the template
+            # case: slot JSON file is not valid JSON
+            #
+            # NOTE: Do not leave the slot locked when the slot JSON file cannot be parsed.
             #
-            slots[slot_num] = json.loads(t.substitute( { 'NO_COMMENT_VALUE': NO_COMMENT_VALUE,
-                                                         'SLOT_VERSION_VALUE': SLOT_VERSION_VALUE,
-                                                         'slot_num': str(slot_num) } ))
+            except ValueError as errcode:
+                ioccc_last_errmsg = f'ERROR: {me}: invalid JSON in slot file: {slot_json_file} failed: <<{errcode}>>'
+                error('%s: invalid JSON in slot_json_file: %s failed: <<%s>>', me, slot_json_file, errcode)
+                unlock_slot()
+                return None
 
             # validate slot JSON file as a python dictionary
             #
@@ -4491,40 +5136,41 @@ def initialize_user_tree(username):
             #
             err_msg = validate_slot_dict_nolock(slots[slot_num], username, slot_num)
             if isinstance(err_msg, str):
-                error(f'{me}: {err_msg} for: username: {username} slot_num: {slot_num}')
+                error('%s: %s for: username: %s slot_num: %s', me, err_msg, username, slot_num)
                 unlock_slot()
                 return None
 
-            # update the JSON for the slot
+        # case: the slot JSON file is missing
+        #
+        else:
+            debug('%s: forming new slot file for username: %s slot_num: %s slot_json_file: %s',
+                  me, username, slot_num, slot_json_file)
+
+            # initialize the slot JSON from the empty slot
             #
-            try:
-                with open(slot_json_file, mode="w", encoding="utf-8") as slot_file_fp:
-                    slot_file_fp.write(json.dumps(slots[slot_num], ensure_ascii=True, indent=4))
-                    slot_file_fp.write('\n')
+            slots[slot_num] = dict(EMPTY_SLOT_DICT, slot=slot_num)
 
-                    # close slot file
-                    #
-                    # NOTE: We explicitly manage the close because we just did a write
-                    #       and we want to catch the case where a write buffer may have
-                    #       not been fully flushed to the file.
-                    #
-                    try:
-                        slot_file_fp.close()
-
-                    except OSError as errcode:
-                        ioccc_last_errmsg = (
-                            f'ERROR: {me}: failed to close: {slot_json_file} '
-                            f'failed: <<{errcode}>>')
-                        error(f'{me}: close writing for slot_json_file: {slot_json_file} '
-                              f'failed: <<{errcode}>>')
-                        unlock_slot()
-                        return None
+            # validate slot JSON file as a python dictionary
+            #
+            # NOTE: This call to validate_slot_dict_nolock(), if does NOT return an error
+            #       indicates we can expect the python dictionary for the slot to have
+            #       values that may be freely tested in this function below.
+            #
+            err_msg = validate_slot_dict_nolock(slots[slot_num], username, slot_num)
+            if isinstance(err_msg, str):
+                error('%s: %s for: username: %s slot_num: %s', me, err_msg, username, slot_num)
+                unlock_slot()
+                return None
 
-            except OSError as errcode:
-                ioccc_last_errmsg = (
-                    f'ERROR: {me}: unable to write JSON slot file: {slot_json_file} '
-                    f'failed: <<{errcode}>>')
-                error(f'{me}: open for writing slot_json_file: {slot_json_file} failed: <<{errcode}>>')
+            # update the JSON for the slot
+            #
+            # NOTE: A new user has all of their slots formed at once.  We do not fsync each
+            #       new empty slot JSON file: should the system crash before the empty slot
+            #       reaches storage, a missing slot JSON file is simply formed again as an
+            #       empty slot, while an empty slot JSON file is reported above.
+            #
+            if not write_slot_json_nolock(slot_json_file, slots[slot_num], False):
+                error('%s: write_slot_json_nolock failed for slot_json_file: %s', me, slot_json_file)
                 unlock_slot()
                 return None
 
@@ -4532,9 +5178,13 @@ def initialize_user_tree(username):
         #
         unlock_slot()
 
+        # note that the slot is now setup
+        #
+        ioccc_setup_slots.add((username, slot_num))
+
     # Return success
     #
-    debug(f'{me}: end: directory tree ready for username: {username}')
+    debug('%s: end: directory tree ready for username: %s', me, username)
     return slots
 #
 # pylint: enable=too-many-statements
@@ -4560,51 +5210,33 @@ def get_all_json_slots(username):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'get_all_json_slots'
+    debug('%s: start', me)
 
-    # firewall - canonical firewall checks on the username arg
+    # firewall - resolve the username into the user directory path
     #
-    if not check_username_arg(username, me):
+    resolved = resolve_user(username, me)
+    if not resolved:
 
-        # The check_username_arg() function above will set ioccc_last_errmsg
-        # and issue log messages due to a username firewall check failure.
+        # The resolve_user() function above will set ioccc_last_errmsg
+        # and issue log messages due to a username check failure.
         #
         return None
-
-    # setup
-    #
-    umask(0o022)
-
-    # firewall - username arg must be a string
-    #
-    if not isinstance(username, str):
-        info(f'{me}: username arg is not a string')
-        return None
-
-    # validate username
-    #
-    if not lookup_username(username):
-        debug(f'{me}: lookup_username failed for username: {username}')
-        return None
-    user_dir = return_user_dir_path(username)
-    if not user_dir:
-        error(f'{me}: return_user_dir_path failed for username: {username}')
-        return None
+    user_dir = resolved[0]
 
     # initialize the user tree in case this is a new user
     #
-    # NOTE: The call to initialize_user_tree() will lock each slot while
+    # NOTE: The call to initialize_user_tree_nocheck() will lock each slot while
     #       the slot is being processed.
     #
-    slots = initialize_user_tree(username)
+    slots = initialize_user_tree_nocheck(username, user_dir)
     if not slots:
-        error(f'{me}: initialize_user_tree failed for username: {username}')
+        error('%s: initialize_user_tree_nocheck failed for username: %s', me, username)
         return None
 
     # return slot information as a python dictionary
     #
-    debug(f'{me}: end: returning all slots for username: {username}')
+    debug('%s: end: returning all slots for username: %s', me, username)
     return slots
 #
 # pylint: enable=too-many-return-statements
@@ -4637,17 +5269,19 @@ def update_slot(username, slot_num, submit_file):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'update_slot'
+    debug('%s: start', me)
 
-    # firewall - canonical firewall checks on the username arg
+    # firewall - resolve the username into the user directory path
     #
-    if not check_username_arg(username, me):
+    resolved = resolve_user(username, me)
+    if not resolved:
 
-        # The check_username_arg() function above will set ioccc_last_errmsg
-        # and issue log messages due to a username firewall check failure.
+        # The resolve_user() function above will set ioccc_last_errmsg
+        # and issue log messages due to a username check failure.
         #
         return False
+    user_dir = resolved[0]
 
     # firewall - canonical firewall checks on the slot_num arg
     #
@@ -4660,107 +5294,108 @@ def update_slot(username, slot_num, submit_file):
 
     # initialize user if needed
     #
-    slots = initialize_user_tree(username)
+    slots = initialize_user_tree_nocheck(username, user_dir)
     if not slots:
-        error(f'{me}: initialize_user_tree failed for username: {username}')
+        error('%s: initialize_user_tree_nocheck failed for username: %s', me, username)
         return False
 
     # determine the slot directory
     #
-    slot_dir = return_slot_dir_path(username, slot_num)
-    if not slot_dir:
-        error(f'{me}: return_slot_dir_path failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
+    slot_dir = f'{user_dir}/{slot_num}'
 
-    # open the file
+    # SHA256 hash the file
     #
-    try:
-        with open(submit_file, "rb") as file_fp:
-            result = hashlib.sha256(file_fp.read())
-
-            # paranoia
-            #
-            if not result or len(result.hexdigest()) != SHA256_HEXLEN:
-                error(f'{me}: invalid SHA-256 hash return')
-                return False
-
-    except OSError as errcode:
+    # NOTE: We use sha256_file_length() to hash the file block by block rather than
+    #       reading the entire submit file into memory.  The length of the submit file
+    #       is counted as we hash, so we do not need to stat the submit file.
+    #
+    submit_hexdigest, submit_length = sha256_file_length(submit_file)
+    if not submit_hexdigest:
         ioccc_last_errmsg = (
-            f'ERROR: {me}: failed to open for username: {username} '
-            f'submit_file: {submit_file} failed: <<{errcode}>>')
-        error(f'{me}: open for username: {username} slot_num: {slot_num} submit_file: {submit_file} '
-              f'failed: <<{errcode}>>')
+            f'ERROR: {me}: failed to SHA256 hash for username: {username} '
+            f'submit_file: {submit_file}')
+        error('%s: sha256_file_length for username: %s slot_num: %s submit_file: %s failed',
+              me, username, slot_num, submit_file)
         return False
 
-    # lock the slot because we are about to change it
+    # paranoia
     #
-    slot_lock_fd = lock_slot(username, slot_num)
-    if not slot_lock_fd:
-        error(f'{me}: lock_slot failed for username: {username} slot_num: {slot_num}')
+    if len(submit_hexdigest) != SHA256_HEXLEN:
+        error('%s: invalid SHA-256 hash return', me)
         return False
 
-    # read the JSON file for the user's slot
+    # lock the slot because we are about to change it
     #
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if not slot_json_file:
-        error(f'{me}: return_slot_json_filename failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
-    slot_dict = read_json_file_nolock(slot_json_file)
-    if not slot_dict:
-        error(f'{me}: read_json_file_nolock failed for username: {username} slot_num: {slot_num} '
-              f'slot_json_file: {slot_json_file}')
-        unlock_slot()
-        return False
-
-    # If the slot previously saved file that has a different name than the new file,
-    # then remove the old file
+    # NOTE: The slot is unlocked when we leave the with block, including when we return early.
     #
-    old_file = return_submit_path(slot_dict, username, slot_num)
-    if isinstance(old_file, str):
+    with slot_lock_nocheck(username, slot_num) as slot_locked:
+        if not slot_locked:
+            error('%s: lock_slot failed for username: %s slot_num: %s', me, username, slot_num)
+            return False
 
-        # remove previously saved file
+        # read the JSON file for the user's slot
         #
-        if submit_file != old_file and os.path.isfile(old_file):
-            try:
-                os.remove(old_file)
-            except OSError as errcode:
-                ioccc_last_errmsg = (
-                    f'ERROR: {me}: failed to remove old file: {old_file} from slot: {slot_num} '
-                    f'failed: <<{errcode}>>')
-                error(f'{me}: os.remove({old_file} for username: {username} slot_num: {slot_num} '
-                      f'failed: <<{errcode}>>')
-                unlock_slot()
-                return False
+        slot_json_file = f'{slot_dir}/slot.json'
+        slot_dict = read_json_file_nolock(slot_json_file)
+        if not slot_dict:
+            error('%s: read_json_file_nolock failed for username: %s slot_num: %s slot_json_file: %s',
+                  me, username, slot_num, slot_json_file)
+            return False
 
-    # set information about this sloe
-    #
-    slot_dict['slot'] = slot_num
-    slot_dict['filename'] = os.path.basename(submit_file)
-    slot_dict['length'] = os.path.getsize(submit_file)
-    slot_dict['date'] = re.sub(r'\+00:00 ', ' ', f'{datetime.datetime.now(datetime.timezone.utc)} UTC')
-    slot_dict['SHA256'] = result.hexdigest()
-    slot_dict['collected'] = False
-    slot_dict['status'] = 'file successfully uploaded into slot.'
+        # If the slot previously saved file that has a different name than the new file,
+        # then remove the old file
+        #
+        old_file = return_submit_path(slot_dict, username, slot_num)
+        if isinstance(old_file, str):
 
-    # save JSON data for the slot
-    #
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if not slot_json_file:
-        error(f'{me}: return_slot_json_filename failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
-    if not write_slot_json_nolock(slot_json_file, slot_dict):
-        error(f'{me}: write_slot_json_nolock failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
+            # remove previously saved file
+            #
+            if submit_file != old_file and os.path.isfile(old_file):
+                try:
+                    os.remove(old_file)
+                except OSError as errcode:
+                    ioccc_last_errmsg = (
+                        f'ERROR: {me}: failed to remove old file: {old_file} from slot: {slot_num} '
+                        f'failed: <<{errcode}>>')
+                    error('%s: os.remove(%s for username: %s slot_num: %s failed: <<%s>>',
+                          me, old_file, username, slot_num, errcode)
+                    return False
 
-    # unlock the slot and report success
-    #
-    unlock_slot()
-    debug(f'{me}: end: updated slot for username: {username} slot_num: {slot_num}')
-    return True
+        # case: the slot already records this very same upload
+        #
+        # When the slot already holds the same filename, length and SHA256 hash, and the slot
+        # still has the status of a fresh upload, only the date would change.  There is no
+        # need to rewrite the slot JSON file for that.
+        #
+        submit_filename = os.path.basename(submit_file)
+        if slot_dict.get('filename') == submit_filename and \
+           slot_dict.get('length') == submit_length and \
+           slot_dict.get('SHA256') == submit_hexdigest and \
+           slot_dict.get('collected') is False and \
+           slot_dict.get('status') == SLOT_STATUS_UPLOADED:
+            debug('%s: end: slot unchanged for username: %s slot_num: %s', me, username, slot_num)
+            return True
+
+        # set information about this sloe
+        #
+        slot_dict['slot'] = slot_num
+        slot_dict['filename'] = submit_filename
+        slot_dict['length'] = submit_length
+        slot_dict['date'] = datetime.datetime.now(datetime.timezone.utc).strftime(DATETIME_USEC_FORMAT)
+        slot_dict['SHA256'] = submit_hexdigest
+        slot_dict['collected'] = False
+        slot_dict['status'] = SLOT_STATUS_UPLOADED
+
+        # save JSON data for the slot
+        #
+        if not write_slot_json_nolock(slot_json_file, slot_dict):
+            error('%s: write_slot_json_nolock failed for username: %s slot_num: %s', me, username, slot_num)
+            return False
+
+        # report success
+        #
+        debug('%s: end: updated slot for username: %s slot_num: %s', me, username, slot_num)
+        return True
 #
 # pylint: enable=too-many-return-statements
 # pylint: enable=too-many-locals
@@ -4792,17 +5427,21 @@ def update_slot_status(username, slot_num, status, set_collected_to_true):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'update_slot_status'
+    debug('%s: start', me)
 
-    # firewall - canonical firewall checks on the username arg
+    # firewall - resolve the username into the user directory path
     #
-    if not check_username_arg(username, me):
+    # NOTE: The resolve_user() function also verifies that the user is a valid user.
+    #
+    resolved = resolve_user(username, me)
+    if not resolved:
 
-        # The check_username_arg() function above will set ioccc_last_errmsg
-        # and issue log messages due to a username firewall check failure.
+        # The resolve_user() function above will set ioccc_last_errmsg
+        # and issue log messages due to a username check failure.
         #
         return False
+    user_dir = resolved[0]
 
     # firewall - canonical firewall checks on the slot_num arg
     #
@@ -4816,67 +5455,64 @@ def update_slot_status(username, slot_num, status, set_collected_to_true):
     # firewall - check args
     #
     if not isinstance(status, str):
-        error(f'{me}: status arg is not a string')
+        error('%s: status arg is not a string', me)
         return False
     if not isinstance(set_collected_to_true, bool):
-        error(f'{me}: set_collected_to_true arg is not a boolean')
+        error('%s: set_collected_to_true arg is not a boolean', me)
         return False
 
-    # must be a valid user
+    # determine the JSON filename for this given slot
     #
-    if not lookup_username(username):
-        debug(f'{me}: lookup_username failed for username: {username}')
-        return False
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if not slot_json_file:
-        debug(f'{me}: return_slot_json_filename failed')
-        return False
+    slot_json_file = f'{user_dir}/{slot_num}/slot.json'
 
     # lock the slot because we are about to change it
     #
-    slot_lock_fd = lock_slot(username, slot_num)
-    if not slot_lock_fd:
-        debug(f'{me}: lock_slot failed')
-        return False
-
-    # read the JSON file for the user's slot
+    # NOTE: The slot is unlocked when we leave the with block, including when we return early.
     #
-    slot_dict = read_json_file_nolock(slot_json_file)
-    if not slot_dict:
-        error(f'{me}: read_json_file_nolock failed for username: {username} slot_num: {slot_num} '
-              f'slot_json_file: {slot_json_file}')
-        unlock_slot()
-        return False
+    with slot_lock_nocheck(username, slot_num) as slot_locked:
+        if not slot_locked:
+            debug('%s: lock_slot failed', me)
+            return False
 
-    # update the status
-    #
-    slot_dict['status'] = status
+        # read the JSON file for the user's slot
+        #
+        slot_dict = read_json_file_nolock(slot_json_file)
+        if not slot_dict:
+            error('%s: read_json_file_nolock failed for username: %s slot_num: %s slot_json_file: %s',
+                  me, username, slot_num, slot_json_file)
+            return False
 
-    # if set_collected_to_true, set collected to False
-    #
-    # paranoia - If there was not a collected value, force it to be False.
-    #
-    if set_collected_to_true or not 'collected' in slot_dict:
-        slot_dict['collected'] = True
+        # case: the slot already has this status and collected value
+        #
+        # There is no need to rewrite the slot JSON file when nothing would change.
+        #
+        if 'status' in slot_dict and slot_dict['status'] == status and \
+           'collected' in slot_dict and (not set_collected_to_true or slot_dict['collected'] is True):
+            debug('%s: end: slot unchanged for username: %s slot_num: %s status: %s', me, username, slot_num, status)
+            return True
 
-    # save JSON data for the slot
-    #
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if not slot_json_file:
-        error(f'{me}: return_slot_json_filename failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
-    if not write_slot_json_nolock(slot_json_file, slot_dict):
-        error(f'{me}: write_slot_json_nolock failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
+        # update the status
+        #
+        slot_dict['status'] = status
 
-    # unlock the slot and report success
-    #
-    unlock_slot()
-    debug(f'{me}: end: updated slot: collected: {slot_dict["collected"]} for '
-          f'username: {username} slot_num: {slot_num} status: {slot_dict["status"]}')
-    return True
+        # if set_collected_to_true, set collected to False
+        #
+        # paranoia - If there was not a collected value, force it to be False.
+        #
+        if set_collected_to_true or not 'collected' in slot_dict:
+            slot_dict['collected'] = True
+
+        # save JSON data for the slot
+        #
+        if not write_slot_json_nolock(slot_json_file, slot_dict):
+            error('%s: write_slot_json_nolock failed for username: %s slot_num: %s', me, username, slot_num)
+            return False
+
+        # report success
+        #
+        debug('%s: end: updated slot: collected: %s for username: %s slot_num: %s status: %s',
+              me, slot_dict["collected"], username, slot_num, slot_dict["status"])
+        return True
 #
 # pylint: enable=too-many-return-statements
 
@@ -4905,17 +5541,21 @@ def update_slot_status_if_submit(username, slot_num, status, submit_file):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'update_slot_status_if_submit'
+    debug('%s: start', me)
 
-    # firewall - canonical firewall checks on the username arg
+    # firewall - resolve the username into the user directory path
     #
-    if not check_username_arg(username, me):
+    # NOTE: The resolve_user() function also verifies that the user is a valid user.
+    #
+    resolved = resolve_user(username, me)
+    if not resolved:
 
-        # The check_username_arg() function above will set ioccc_last_errmsg
-        # and issue log messages due to a username firewall check failure.
+        # The resolve_user() function above will set ioccc_last_errmsg
+        # and issue log messages due to a username check failure.
         #
         return False
+    user_dir = resolved[0]
 
     # firewall - canonical firewall checks on the slot_num arg
     #
@@ -4929,75 +5569,87 @@ def update_slot_status_if_submit(username, slot_num, status, submit_file):
     # firewall - check args
     #
     if not isinstance(status, str):
-        error(f'{me}: status arg is not a string')
+        error('%s: status arg is not a string', me)
         return False
     if not isinstance(submit_file, str):
-        error(f'{me}: submit_file arg is not a string')
+        error('%s: submit_file arg is not a string', me)
         return False
 
-    # must be a valid user
-    #
-    if not lookup_username(username):
-        debug(f'{me}: lookup_username failed for username: {username}')
-        return False
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if not slot_json_file:
-        debug(f'{me}: return_slot_json_filename failed')
-        return False
-
-    # lock the slot because we are about to change it
+    # determine the JSON filename for this given slot
     #
-    slot_lock_fd = lock_slot(username, slot_num)
-    if not slot_lock_fd:
-        debug(f'{me}: lock_slot failed')
-        return False
+    slot_json_file = f'{user_dir}/{slot_num}/slot.json'
 
-    # read the JSON file for the user's slot
-    #
-    slot_dict = read_json_file_nolock(slot_json_file)
-    if not slot_dict:
-        error(f'{me}: read_json_file_nolock failed for username: {username} slot_num: {slot_num} '
-              f'slot_json_file: {slot_json_file}')
-        unlock_slot()
-        return False
+    # peek at the slot before we lock it
+    #
+    # Because write_slot_json_nolock() replaces the slot JSON file in one step, we may read
+    # the slot JSON file without holding the slot lock and still see a complete slot JSON file.
+    # When the slot no longer holds submit_file, or the slot already has this status, there is
+    # nothing to write, and so we do not need to wait for the slot lock.  Otherwise we lock the
+    # slot and check the slot again below before we change it.
+    #
+    peek_slot_dict = read_json_file_nolock(slot_json_file)
+    if peek_slot_dict and 'filename' in peek_slot_dict and \
+       (submit_file != peek_slot_dict['filename'] or \
+        ('status' in peek_slot_dict and peek_slot_dict['status'] == status)):
+        debug('%s: end: no status change needed for username: %s slot_num: %s for submit file: %s',
+              me, username, slot_num, submit_file)
+        return True
 
-    # check the slot filename for a match against submit_file
+    # lock the slot because we are about to change it
     #
-    if not 'filename' in slot_dict:
-        error(f'{me}: missing filename for username: {username} slot_num: {slot_num} '
-              f'slot_json_file: {slot_json_file}')
-        unlock_slot()
-        return False
-    if submit_file != slot_dict['filename']:
+    # NOTE: The slot is unlocked when we leave the with block, including when we return early.
+    #
+    with slot_lock_nocheck(username, slot_num) as slot_locked:
+        if not slot_locked:
+            debug('%s: lock_slot failed', me)
+            return False
 
-        # slot was updated before we could change the status.  The status arg applies to
-        # a different (previous submit file), so we simply and silently drop this status change
-        # without any error reporting.
+        # read the JSON file for the user's slot
         #
-        unlock_slot()
-        return True
+        slot_dict = read_json_file_nolock(slot_json_file)
+        if not slot_dict:
+            error('%s: read_json_file_nolock failed for username: %s slot_num: %s slot_json_file: %s',
+                  me, username, slot_num, slot_json_file)
+            return False
 
-    # update the status
-    #
-    slot_dict['status'] = status
+        # check the slot filename for a match against submit_file
+        #
+        if not 'filename' in slot_dict:
+            error('%s: missing filename for username: %s slot_num: %s slot_json_file: %s',
+                  me, username, slot_num, slot_json_file)
+            return False
+        if submit_file != slot_dict['filename']:
 
-    # save JSON data for the slot
-    #
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if not slot_json_file:
-        error(f'{me}: return_slot_json_filename failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
-    if not write_slot_json_nolock(slot_json_file, slot_dict):
-        error(f'{me}: write_slot_json_nolock failed for username: {username} slot_num: {slot_num}')
-        unlock_slot()
-        return False
+            # slot was updated before we could change the status.  The status arg applies to
+            # a different (previous submit file), so we simply and silently drop this status change
+            # without any error reporting.
+            #
+            return True
 
-    # unlock the slot and report success
-    #
-    unlock_slot()
-    debug(f'{me}: end: updated slot status username: {username} slot_num: {slot_num} for submit file: {submit_file}')
-    return True
+        # case: the slot already has this status
+        #
+        # There is no need to rewrite the slot JSON file when nothing would change.
+        #
+        if 'status' in slot_dict and slot_dict['status'] == status:
+            debug('%s: end: slot status unchanged for username: %s slot_num: %s for submit file: %s',
+                  me, username, slot_num, submit_file)
+            return True
+
+        # update the status
+        #
+        slot_dict['status'] = status
+
+        # save JSON data for the slot
+        #
+        if not write_slot_json_nolock(slot_json_file, slot_dict):
+            error('%s: write_slot_json_nolock failed for username: %s slot_num: %s', me, username, slot_num)
+            return False
+
+        # report success
+        #
+        debug('%s: end: updated slot status username: %s slot_num: %s for submit file: %s',
+              me, username, slot_num, submit_file)
+        return True
 #
 # pylint: enable=too-many-return-statements
 
@@ -5020,35 +5672,77 @@ def read_json_file_nolock(json_file):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'read_json_file_nolock'
+    debug('%s: start', me)
 
-    # try to read JSON contents
+    # case: the JSON file has not changed since we last read it
     #
     try:
-        with open(json_file, 'r', encoding='utf-8') as j_fp:
+        json_stamp = return_file_stamp(os.stat(json_file))
+        with ioccc_json_cache_lock:
+            cached = ioccc_json_cache.get(json_file)
+            if cached and cached[0] == json_stamp:
+                ioccc_json_cache.move_to_end(json_file)
+        if cached and cached[0] == json_stamp:
+            debug('%s: end: return cached python dictionary for JSON file: %s', me, json_file)
+            return dict(cached[1])
 
-            # return slot information as a python dictionary
-            #
-            try:
-                slot_dict = json.load(j_fp)
-            except json.JSONDecodeError:
-                ioccc_last_errmsg = f'ERROR: {me}: invalid JSON in file: {json_file}'
-                error(f'{me}:  invalid JSON in file: {json_file}')
-                return []
-            except UnicodeDecodeError:
-                ioccc_last_errmsg = f'ERROR: {me}: invalid Unicode data in file: {json_file}'
-                error(f'{me}:  invalid Unicode data in file: {json_file}')
-                return []
-            debug(f'{me}: end: return python dictionary for JSON file: {json_file}')
-            return slot_dict
+    # Do not use: except OSError as errcode: because we will report the error when we open below
+    #
+    except OSError:
+        pass
+
+    # try to read JSON contents
+    #
+    # We read the whole JSON file with a single read of the size reported by fstat,
+    # and note the stamp of the very JSON file that we read.
+    #
+    # NOTE: The json_stamp is None when the JSON file was recently modified.
+    #
+    try:
+        j_fd = os.open(json_file, os.O_RDONLY)
+        try:
+            json_stat = os.fstat(j_fd)
+            json_stamp = return_settled_file_stamp(json_stat)
+            json_bytes = os.read(j_fd, json_stat.st_size)
+        finally:
+            os.close(j_fd)
 
     except OSError as errcode:
         ioccc_last_errmsg = f'ERROR: {me}: cannot open JSON in: {json_file} failed: <<{errcode}>>'
-        error(f'{me}: read JSON for json_file: {json_file} '
-              f'failed: <<{errcode}>>')
+        error('%s: read JSON for json_file: %s failed: <<%s>>', me, json_file, errcode)
+        return []
+
+    # return slot information as a python dictionary
+    #
+    # NOTE: Both orjson and json report invalid JSON by raising a ValueError,
+    #       of which UnicodeDecodeError is a subclass.
+    #
+    try:
+        slot_dict = json_loads(json_bytes)
+    except UnicodeDecodeError:
+        ioccc_last_errmsg = f'ERROR: {me}: invalid Unicode data in file: {json_file}'
+        error('%s:  invalid Unicode data in file: %s', me, json_file)
+        return []
+    except ValueError:
+        ioccc_last_errmsg = f'ERROR: {me}: invalid JSON in file: {json_file}'
+        error('%s:  invalid JSON in file: %s', me, json_file)
         return []
 
+    # remember the python dictionary for when the JSON file is read again
+    #
+    # We do not remember the python dictionary of a recently modified JSON file
+    # because it could be modified again without changing its stamp.
+    #
+    if json_stamp and isinstance(slot_dict, dict):
+        with ioccc_json_cache_lock:
+            ioccc_json_cache[json_file] = (json_stamp, dict(slot_dict))
+            ioccc_json_cache.move_to_end(json_file)
+            while len(ioccc_json_cache) > JSON_CACHE_MAX:
+                ioccc_json_cache.popitem(last=False)
+    debug('%s: end: return python dictionary for JSON file: %s', me, json_file)
+    return slot_dict
+
 
 # pylint: disable=too-many-statements
 # pylint: disable=too-many-branches
@@ -5072,29 +5766,89 @@ def read_state():
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    global ioccc_state_cache
+    global ioccc_init_state_bytes
+    # pylint: enable=global-statement
+    me = 'read_state'
+    debug('%s: start', me)
+
+    # case: the state file has not changed since we last read it
+    #
+    if ioccc_state_cache:
+        try:
+            state_stat = os.stat(STATE_FILE)
+            if ioccc_state_cache[0] == return_file_stamp(state_stat):
+                debug('%s: end: returning cached open and close dates', me)
+                return ioccc_state_cache[1], ioccc_state_cache[2]
+
+        # Do not use: except OSError as errcode: because we will read the state file below
+        #
+        except OSError:
+            pass
+        ioccc_state_cache = None
 
     # Lock the state file
     #
     state_lock_fd = ioccc_file_lock(STATE_FILE_LOCK)
     if not state_lock_fd:
-        error(f'{me}: failed to lock file for STATE_FILE_LOCK: {STATE_FILE_LOCK}')
+        error('%s: failed to lock file for STATE_FILE_LOCK: %s', me, STATE_FILE_LOCK)
         return None, None
 
-    # If there is no state file, or if the state file is empty, copy it from the initial state file
+    # note the stamp of the state file we are about to read
+    #
+    # NOTE: We hold the state file lock, so the state file will not be updated
+    #       between this stat and our reading of the state file.
+    #
+    # NOTE: The state_stamp is None when the state file was recently modified,
+    #       and so we will not remember the open and close dates below.
+    #
+    # NOTE: Because update_state() replaces the state file in one step, the state file
+    #       is never empty.  We only need to copy the initial state file when there is
+    #       no state file.
+    #
+    try:
+        state_stat = os.stat(STATE_FILE)
+        state_stamp = return_settled_file_stamp(state_stat)
+
+    # case: there is no state file, so copy it from the initial state file
     #
-    if not os.path.isfile(STATE_FILE) or os.path.getsize(STATE_FILE) <= 0:
+    # NOTE: We write the initial state in a single write rather than using shutil.copy2().
+    #       Like write_json_file_nolock(), we write a temporary file and then rename it
+    #       into place, so that the state file is never empty or partially written.
+    #
+    except FileNotFoundError:
+        tmp_state_file = f'{STATE_FILE}.tmp.{os.getpid()}'
         try:
-            shutil.copy2(INIT_STATE_FILE, STATE_FILE, follow_symlinks=True)
+            if ioccc_init_state_bytes is None:
+                with open(INIT_STATE_FILE, 'rb') as init_sf_fp:
+                    ioccc_init_state_bytes = init_sf_fp.read()
+            sf_fd = os.open(tmp_state_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DSYNC, 0o664)
+            with os.fdopen(sf_fd, mode="wb") as sf_fp:
+                sf_fp.write(ioccc_init_state_bytes)
+            os.replace(tmp_state_file, STATE_FILE)
+            with ioccc_json_cache_lock:
+                ioccc_json_cache.pop(STATE_FILE, None)
 
         except OSError as errcode:
             ioccc_last_errmsg = f'ERROR: {me}: cannot cp -p {INIT_STATE_FILE} {STATE_FILE} failed: <<{errcode}>>'
-            error(f'{me}: cp -p {INIT_STATE_FILE} {STATE_FILE} failed: <<{errcode}>>')
+            error('%s: cp -p %s %s failed: <<%s>>', me, INIT_STATE_FILE, STATE_FILE, errcode)
+
+            # do not leave a partial temporary file behind
+            #
+            try:
+                os.remove(tmp_state_file)
+            except OSError:
+                pass
             ioccc_file_unlock()
             return None, None
+        state_stamp = None
+
+    # Do not use: except OSError as errcode: because read_json_file_nolock() will report the error
+    #
+    except OSError:
+        state_stamp = None
 
     # read the state
     #
@@ -5108,41 +5862,40 @@ def read_state():
     #
     if not state:
         ioccc_last_errmsg = f'Warning: {me}: unable to read the state file: {STATE_FILE}'
-        warning(f'{me}: unable to read the state file: {STATE_FILE}')
+        warning('%s: unable to read the state file: %s', me, STATE_FILE)
         return None, None
 
     # firewall check state file no_comment
     #
     if not 'no_comment' in state:
         ioccc_last_errmsg = f'ERROR: {me}: username is missing from state file'
-        error(f'{me}: username is missing from state file')
+        error('%s: username is missing from state file', me)
         return None, None
     if not isinstance(state['no_comment'], str):
         ioccc_last_errmsg = f'ERROR: {me}: no_comment is not a string in state file'
-        error(f'{me}: no_comment not a string for STATE_FILE: {STATE_FILE}')
+        error('%s: no_comment not a string for STATE_FILE: %s', me, STATE_FILE)
         return None, None
     if state['no_comment'] != NO_COMMENT_VALUE:
         ioccc_last_errmsg = f'ERROR: {me}: invalid JSON no_comment in state file'
-        error(f'{me}: invalid JSON no_comment for STATE_FILE: {STATE_FILE} '
-              f'state["no_comment"]: {state["no_comment"]} != '
-              f'NO_COMMENT_VALUE: {NO_COMMENT_VALUE}')
+        error('%s: invalid JSON no_comment for STATE_FILE: %s state["no_comment"]: %s != NO_COMMENT_VALUE: %s',
+              me, STATE_FILE, state["no_comment"], NO_COMMENT_VALUE)
         return None, None
 
     # firewall check state file state_JSON_format_version
     #
     if not 'state_JSON_format_version' in state:
         ioccc_last_errmsg = f'ERROR: {me}: state_JSON_format_version is missing from state file'
-        error(f'{me}: state_JSON_format_version is missing from state file')
+        error('%s: state_JSON_format_version is missing from state file', me)
         return None, None
     if not isinstance(state['state_JSON_format_version'], str):
         ioccc_last_errmsg = f'ERROR: {me}: state_JSON_format_version is not a string in state file'
-        error(f'{me}: state_JSON_format_version not a string for STATE_FILE: {STATE_FILE}')
+        error('%s: state_JSON_format_version not a string for STATE_FILE: %s', me, STATE_FILE)
         return None, None
     if state['state_JSON_format_version'] != STATE_VERSION_VALUE:
         ioccc_last_errmsg = f'ERROR: {me}: invalid JSON state_JSON_format_version in state file'
-        error(f'{me}: invalid state_JSON_format_version for '
-              f'STATE_FILE: {STATE_FILE} state_JSON_format_version: <<{state["state_JSON_format_version"]}>> != '
-              f'STATE_VERSION_VALUE: {STATE_VERSION_VALUE}')
+        error('%s: invalid state_JSON_format_version for STATE_FILE: %s '
+              'state_JSON_format_version: <<%s>> != STATE_VERSION_VALUE: %s',
+              me, STATE_FILE, state["state_JSON_format_version"], STATE_VERSION_VALUE)
         unlock_slot()
         return None, None
 
@@ -5150,45 +5903,50 @@ def read_state():
     #
     if not 'open_date' in state:
         ioccc_last_errmsg = f'ERROR: {me}: open_date is missing from state file'
-        error(f'{me}: open_date is missing from state file')
+        error('%s: open_date is missing from state file', me)
         return None, None
     if not isinstance(state['open_date'], str):
         ioccc_last_errmsg = f'ERROR: {me}: state file open_date is not a string'
-        error(f'{me}: open_date is not a string for STATE_FILE: {STATE_FILE}')
+        error('%s: open_date is not a string for STATE_FILE: %s', me, STATE_FILE)
         return None, None
     try:
-        open_datetime = datetime.datetime.strptime(state['open_date'], DATETIME_USEC_FORMAT)
+        open_datetime = parse_datetime_usec(state['open_date'])
     except ValueError as errcode:
         ioccc_last_errmsg = (
                 f'ERROR: {me}: state file open_date is not in proper datetime '
             f'format: <<{state["open_date"]}>> failed: <<{errcode}>>')
-        error(f'{me}: datetime.datetime.strptime of open_date for STATE_FILE: {STATE_FILE} '
-              f'open_date: {state["open_date"]} failed: <<{errcode}>>')
+        error('%s: parse_datetime_usec of open_date for STATE_FILE: %s open_date: %s failed: <<%s>>',
+              me, STATE_FILE, state["open_date"], errcode)
         return None, None
 
     # convert close date string into a datetime value
     #
     if not 'close_date' in state:
         ioccc_last_errmsg = f'ERROR: {me}: close_date is missing from state file'
-        error(f'{me}: close_date is missing from state file')
+        error('%s: close_date is missing from state file', me)
         return None, None
     if not isinstance(state['close_date'], str):
         ioccc_last_errmsg = f'ERROR: {me}: state file close_date is not a string'
-        error(f'{me}: close_date is not a string for STATE_FILE: {STATE_FILE}')
+        error('%s: close_date is not a string for STATE_FILE: %s', me, STATE_FILE)
         return None, None
     try:
-        close_datetime = datetime.datetime.strptime(state['close_date'], DATETIME_USEC_FORMAT)
+        close_datetime = parse_datetime_usec(state['close_date'])
     except ValueError as errcode:
         ioccc_last_errmsg = (
             f'ERROR: {me}: state file close_date is not in proper datetime '
             f'format: <<{state["close_date"]}>>')
-        error(f'{me}: datetime.datetime.strptime of close_date for STATE_FILE: {STATE_FILE} '
-              f'close_date: {state["close_date"]} failed: <<{errcode}>>')
+        error('%s: parse_datetime_usec of close_date for STATE_FILE: %s close_date: %s failed: <<%s>>',
+              me, STATE_FILE, state["close_date"], errcode)
         return None, None
 
+    # remember the open and close dates until the state file changes
+    #
+    if state_stamp:
+        ioccc_state_cache = (state_stamp, open_datetime, close_datetime)
+
     # return open and close dates
     #
-    debug(f'{me}: end: returning open and close dates')
+    debug('%s: end: returning open and close dates', me)
     return open_datetime, close_datetime
 #
 # pylint: enable=too-many-statements
@@ -5211,94 +5969,76 @@ def update_state(open_date, close_date):
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    global ioccc_state_cache
+    # pylint: enable=global-statement
+    me = 'update_state'
+    debug('%s: start', me)
     write_sucessful = True
 
     # firewall - open_date must be a string in DATETIME_USEC_FORMAT format
     #
     if not isinstance(open_date, str):
         ioccc_last_errmsg = f'ERROR: {me}: open_date is not a string'
-        error(f'{me}: open_date arg is not a string')
+        error('%s: open_date arg is not a string', me)
         return False
     try:
         # pylint: disable=unused-variable
-        open_datetime = datetime.datetime.strptime(open_date, DATETIME_USEC_FORMAT)
+        open_datetime = parse_datetime_usec(open_date)
     except ValueError as errcode:
         ioccc_last_errmsg = (
             f'ERROR: {me}: open_date arg not in proper datetime format '
             f'failed: <<{errcode}>>')
-        error(f'{me}: open_date arg not in proper datetime format '
-              f'failed: <<{errcode}>>')
+        error('%s: open_date arg not in proper datetime format failed: <<%s>>', me, errcode)
         return False
 
     # firewall - close_date must be a string in DATETIME_USEC_FORMAT format
     #
     if not isinstance(close_date, str):
         ioccc_last_errmsg = f'ERROR: {me}: close_date is not a string'
-        error(f'{me}: close_date arg is not a string')
+        error('%s: close_date arg is not a string', me)
         return False
     try:
         # pylint: disable=unused-variable
-        close_datetime = datetime.datetime.strptime(close_date, DATETIME_USEC_FORMAT)
+        close_datetime = parse_datetime_usec(close_date)
     except ValueError as errcode:
         ioccc_last_errmsg = (
             f'ERROR: {me}: state file close_date is not in proper datetime format '
             f'format: <<{close_date}>> failed: <<{errcode}>>')
-        error(f'{me}: datetime.datetime.strptime of close_date arg: {close_date} format '
-              f'failed: <<{errcode}>>')
+        error('%s: parse_datetime_usec of close_date arg: %s format failed: <<%s>>', me, close_date, errcode)
         return False
 
     # Lock the state file
     #
     state_lock_fd = ioccc_file_lock(STATE_FILE_LOCK)
     if not state_lock_fd:
-        error(f'{me}: failed to lock file for STATE_FILE_LOCK: {STATE_FILE_LOCK}')
+        error('%s: failed to lock file for STATE_FILE_LOCK: %s', me, STATE_FILE_LOCK)
         return False
 
     # write JSON data into the state file
     #
-    try:
-        with open(STATE_FILE, 'w', encoding='utf-8') as sf_fp:
-            t = Template(DEFAULT_JSON_STATE_TEMPLATE)
-            state = json.loads(t.substitute( { 'NO_COMMENT_VALUE': NO_COMMENT_VALUE,
-                                               'STATE_VERSION_VALUE': STATE_VERSION_VALUE,
-                                               'OPEN_DATE': open_date,
-                                               'CLOSE_DATE': close_date } ))
-            sf_fp.write(json.dumps(state,
-                                   ensure_ascii = True,
-                                   indent = 4))
-            sf_fp.write('\n')
-
-            # close state file
-            #
-            # NOTE: We explicitly manage the close because we just did a write
-            #       and we want to catch the case where a write buffer may have
-            #       not been fully flushed to the file.
-            #
-            try:
-                sf_fp.close()
-            except OSError as errcode:
-                error(f'{me}: close writing for STATE_FILE: {STATE_FILE} '
-                      f'failed: <<{errcode}>>')
-                ioccc_last_errmsg = f'ERROR: {me}: failed to close: {STATE_FILE} failed: <<{errcode}>>'
-                write_sucessful = False
-                # fall thru
-
-    except OSError:
-        ioccc_last_errmsg = f'ERROR: {me}: cannot write state file: {STATE_FILE}'
+    t = Template(DEFAULT_JSON_STATE_TEMPLATE)
+    state = json.loads(t.substitute( { 'NO_COMMENT_VALUE': NO_COMMENT_VALUE,
+                                       'STATE_VERSION_VALUE': STATE_VERSION_VALUE,
+                                       'OPEN_DATE': open_date,
+                                       'CLOSE_DATE': close_date } ))
+    if not write_json_file_nolock(STATE_FILE, state):
+        error('%s: write of STATE_FILE: %s failed', me, STATE_FILE)
         write_sucessful = False
         # fall thru
 
+    # forget the previously read contest dates
+    #
+    ioccc_state_cache = None
+
     # Unlock the state file
     #
     ioccc_file_unlock()
 
     # return success
     #
-    debug(f'{me}: end: update_state: {write_sucessful}')
+    debug('%s: end: update_state: %s', me, write_sucessful)
     return write_sucessful
 
 
@@ -5332,94 +6072,107 @@ def contest_open_close(user_dict, open_datetime, close_datetime):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'contest_open_close'
+    debug('%s: start', me)
 
     # determine the datetime of now
     #
     now = datetime.datetime.now(datetime.timezone.utc)
-    debug(f'{me}: now: {now}')
+    debug('%s: now: %s', me, now)
 
     # firewall - open_datetime arg must be in datetime in format
     #
     if not open_datetime:
-        error(f'{me}: open_datetime arg is None')
+        error('%s: open_datetime arg is None', me)
         return False, False, False
     if not isinstance(open_datetime, datetime.datetime):
-        error(f'{me}: open_datetime arg is not a datetime object')
+        error('%s: open_datetime arg is not a datetime object', me)
         return False, False, False
-    debug(f'{me}: open_datetime: {open_datetime}')
+    debug('%s: open_datetime: %s', me, open_datetime)
 
     # firewall - close_datetime arg must be in datetime format
     #
     if not close_datetime:
-        error(f'{me}: close_datetime arg is None')
+        error('%s: close_datetime arg is None', me)
         return False, False, False
     if not isinstance(close_datetime, datetime.datetime):
-        error(f'{me}: close_datetime arg is not a datetime object')
+        error('%s: close_datetime arg is not a datetime object', me)
         return False, False, False
-    debug(f'{me}: close_datetime: {close_datetime}')
+    debug('%s: close_datetime: %s', me, close_datetime)
+
+    # case: user may ignore the date
+    #
+    # For users that are allowed to ignore the date, the contest is always open,
+    # even if we are outside the contest open-close internal.  We check for this
+    # before the full user information firewall check below.
+    #
+    # NOTE: The user_dict is normally from lookup_username() which has already
+    #       checked the user information with validate_user_dict_nolock().
+    #
+    if isinstance(user_dict, dict) and user_dict.get('ignore_date') is True:
+        debug('%s: end: ignoring close date for username: %s', me, user_dict.get('username'))
+        return False, True, False
 
     # convert open_datetime into a UTC timestamp
     #
     try:
         open_datetime_utc = open_datetime.replace(tzinfo=datetime.timezone.utc)
     except ValueError as errcode:
-        error(f'{me}: UTC conversion of open_datetime failed: <<{errcode}>>')
+        error('%s: UTC conversion of open_datetime failed: <<%s>>', me, errcode)
         return False, False, False
-    debug(f'{me}: open_datetime_utc: {open_datetime_utc}')
-    debug(f'{me}: now.timestamp() < open_datetime_utc.timestamp(): '
-          f'{now.timestamp() < open_datetime_utc.timestamp()}')
-    debug(f'{me}: now.timestamp() >= open_datetime_utc.timestamp(): '
-          f'{now.timestamp() >= open_datetime_utc.timestamp()}')
+    debug('%s: open_datetime_utc: %s', me, open_datetime_utc)
+    debug('%s: now.timestamp() < open_datetime_utc.timestamp(): %s',
+          me, now.timestamp() < open_datetime_utc.timestamp())
+    debug('%s: now.timestamp() >= open_datetime_utc.timestamp(): %s',
+          me, now.timestamp() >= open_datetime_utc.timestamp())
 
     # convert close_datetime into a UTC timestamp
     #
     try:
         close_datetime_utc = close_datetime.replace(tzinfo=datetime.timezone.utc)
     except ValueError as errcode:
-        error(f'{me}: UTC conversion of close_datetime failed: <<{errcode}>>')
+        error('%s: UTC conversion of close_datetime failed: <<%s>>', me, errcode)
         return False, False, False
-    debug(f'{me}: close_datetime_utc: {close_datetime_utc}')
-    debug(f'{me}: now.timestamp() < close_datetime_utc.timestamp(): '
-          f'{now.timestamp() < close_datetime_utc.timestamp()}')
-    debug(f'{me}: now.timestamp() >= close_datetime_utc.timestamp(): '
-          f'{now.timestamp() >= close_datetime_utc.timestamp()}')
+    debug('%s: close_datetime_utc: %s', me, close_datetime_utc)
+    debug('%s: now.timestamp() < close_datetime_utc.timestamp(): %s',
+          me, now.timestamp() < close_datetime_utc.timestamp())
+    debug('%s: now.timestamp() >= close_datetime_utc.timestamp(): %s',
+          me, now.timestamp() >= close_datetime_utc.timestamp())
 
     # firewall - check the user information
     #
     if not validate_user_dict_nolock(user_dict):
-        error(f'{me}: validate_user_dict_nolock failed')
+        error('%s: validate_user_dict_nolock failed', me)
         return False, False, False
 
     # paranoia - must have ignore_date in user_dict
     #
     if not 'ignore_date' in user_dict:
-        error(f'{me}: ignore_date is missing from user_dict')
+        error('%s: ignore_date is missing from user_dict', me)
         return False, False, False
 
     # For users that are allowed to ignore the date, the contest is always open,
     # even if we are outside the contest open-close internal.
     #
     if user_dict['ignore_date']:
-        debug(f'{me}: end: ignoring close date for username: {user_dict["username"]}')
+        debug('%s: end: ignoring close date for username: %s', me, user_dict["username"])
         return False, True, False
 
     # case: now is before the contest is open
     #
     if now.timestamp() < open_datetime_utc.timestamp():
-        debug(f'{me}: end: contest is not yet open')
+        debug('%s: end: contest is not yet open', me)
         return True, False, False
 
     # case: now is after the contest open period
     #
     if now.timestamp() >= close_datetime_utc.timestamp():
-        debug(f'{me}: end: contest is no longer open')
+        debug('%s: end: contest is no longer open', me)
         return False, False, True
 
     # case: contest is open now
     #
-    debug(f'{me}: end: contest is open')
+    debug('%s: end: contest is open', me)
     return False, True, False
 #
 # pylint: enable=too-many-return-statements
@@ -5441,13 +6194,33 @@ def return_secret():
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    # pylint: disable-next=global-statement
+    global ioccc_secret_cache
+    me = 'return_secret'
+    debug('%s: start', me)
+
+    # case: the secret file has not changed since we last read it
+    #
+    if ioccc_secret_cache and ioccc_secret_cache[0] == SECRET_FILE:
+        try:
+            secret_stat = os.stat(SECRET_FILE)
+            if ioccc_secret_cache[1] == return_file_stamp(secret_stat):
+                debug('%s: end: returning cached secret key', me)
+                return ioccc_secret_cache[2]
+
+        # Do not use: except OSError as errcode: because we will report the error when we open below
+        #
+        except OSError:
+            pass
+    ioccc_secret_cache = None
 
     # Try read the 1st line of the SECRET_FILE, ignoring the newline:
     #
+    secret_stamp = None
     try:
         with open(SECRET_FILE, 'r', encoding='utf-8') as secret:
+            secret_stat = os.fstat(secret.fileno())
+            secret_stamp = return_settled_file_stamp(secret_stat)
             secret_key = secret.read().rstrip()
 
     except OSError as errcode:
@@ -5456,31 +6229,104 @@ def return_secret():
         # IMPORTANT: This exception case may not work well in production as
         #            different instances of this app will have different secrets.
         #
-        warning(f'{me}: open SECRET_FILE: {SECRET_FILE} failed: <<{errcode}>>')
-        warning(f'{me}: generating secret_key on the fly: failed to obtain it from SECRET_FILE: {SECRET_FILE}')
+        warning('%s: open SECRET_FILE: %s failed: <<%s>>', me, SECRET_FILE, errcode)
+        warning('%s: generating secret_key on the fly: failed to obtain it from SECRET_FILE: %s', me, SECRET_FILE)
         secret_key = f'{uuid.uuid4()}//{randrange(1000)}.{randrange(1000)}'
+        secret_stamp = None
         # fall thru
 
     # paranoia - not a string
     #
     if not isinstance(secret_key, str):
-        warning(f'{me}: generating secret_key on the fly: non-string found in from SECRET_FILE: {SECRET_FILE}')
+        warning('%s: generating secret_key on the fly: non-string found in from SECRET_FILE: %s', me, SECRET_FILE)
         secret_key = f'{uuid.uuid4()}/*{randrange(1000)}.{randrange(1000)}'
         # fall thru
 
     # paranoia - too short
     #
     elif len(secret_key) < MIN_SECRET_LEN:
-        warning(f'{me}: generating secret_key on the fly: string too short in SECRET_FILE: {SECRET_FILE}')
+        warning('%s: generating secret_key on the fly: string too short in SECRET_FILE: %s', me, SECRET_FILE)
         secret_key = f'{uuid.uuid4()}*/{randrange(1000)}.{randrange(1000)}'
         # fall thru
 
+    # case: we read a usable secret key from the secret file, remember it
+    #
+    elif secret_stamp:
+        ioccc_secret_cache = (SECRET_FILE, secret_stamp, secret_key)
+
     # return secret key
     #
-    debug(f'{me}: end: returning secret key')
+    debug('%s: end: returning secret key', me)
     return secret_key
 
 
+def return_syslog_address():
+    """
+    Return the address of the local syslog service
+
+    We determine the address of the local syslog service the first time this function
+    is called.  Later calls return that same address without probing the filesystem again.
+
+    Returns:
+        path of the local syslog socket, or
+        "/dev/null" if the local syslog socket is unknown
+    """
+
+    # setup
+    #
+    # pylint: disable-next=global-statement
+    global ioccc_syslog_address
+
+    # case: we already know the syslog address
+    #
+    if ioccc_syslog_address:
+        return ioccc_syslog_address
+
+    # determine the logging address
+    #
+    log_address = None
+    try:
+        if os.path.exists("/var/run/syslog"):
+
+            # macOS
+            #
+            log_address = "/var/run/syslog"
+
+        elif os.path.exists("/run/systemd/journal/dev-log"):
+
+            # Linux and related friends
+            #
+            log_address = "/run/systemd/journal/dev-log"
+
+        elif os.path.exists("/dev/log"):
+
+            # Linux and related friends symlink
+            #
+            log_address = "/dev/log"
+
+        elif os.path.exists("/var/run/log"):
+
+            # FreeBSD and NetBSD and related friends
+            #
+            log_address = "/var/run/log"
+
+    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+    #
+    except OSError:
+        pass
+
+    if not log_address:
+
+        # log access is unknown - use /dev/null
+        #
+        log_address = "/dev/null"
+
+    # remember the syslog address
+    #
+    ioccc_syslog_address = log_address
+    return ioccc_syslog_address
+
+
 # pylint: disable=too-many-branches
 # pylint: disable=too-many-statements
 #
@@ -5514,16 +6360,23 @@ def setup_logger(logtype, dbglvl) -> None:
 
     # setup
     #
-    # pylint: disable-next=global-statement
+    # pylint: disable=global-statement
     global ioccc_logger
-    me = inspect.currentframe().f_code.co_name
+    global ioccc_logger_config
+    # pylint: enable=global-statement
+    me = 'setup_logger'
     # We do NOT want to call debug start from this function because this function does the debug setup
     #no# debug(f'{me}: start')
-    logging_level = logging.INFO
 
     # case: logtype is not a string (such as None) or unknown logtype string
     #
-    if not logtype or not isinstance(logtype, str) or not logtype.lower() in {'stdout', 'stderr', 'syslog', 'none'}:
+    if not logtype or not isinstance(logtype, str):
+
+        # do not change the log state
+        #
+        return
+    log_type = logtype.lower()
+    if not log_type in LOGTYPE_SET:
 
         # do not change the log state
         #
@@ -5531,32 +6384,26 @@ def setup_logger(logtype, dbglvl) -> None:
 
     # case: logtype is "none"
     #
-    if logtype.lower() == "none":
+    if log_type == "none":
 
         # do not log
         #
         ioccc_logger = None
+        ioccc_logger_config = None
         return
 
     # set the debug level based on dbglvl
     #
     # We default to logging.INFO is dbglvl is not a string (such as None) or unknown dbglvl string
     #
+    logging_level = logging.INFO
     if isinstance(dbglvl, str):
-        # pylint: disable-next=consider-using-in
-        if dbglvl.lower() == "dbg" or dbglvl.lower() == "debug":
-            logging_level = logging.DEBUG
-        elif dbglvl.lower() == "info":
-            logging_level = logging.INFO
-        # pylint: disable-next=consider-using-in
-        elif dbglvl.lower() == "warn" or dbglvl.lower() == "warning":
-            logging_level = logging.WARNING
-        # pylint: disable-next=consider-using-in
-        elif dbglvl.lower() == "err" or dbglvl.lower() == "error":
-            logging_level = logging.ERROR
-        # pylint: disable-next=consider-using-in
-        elif dbglvl.lower() == "crit" or dbglvl.lower() == "critical":
-            logging_level = logging.CRITICAL
+        logging_level = LOGGING_LEVEL_MAP.get(dbglvl.lower(), logging.INFO)
+
+    # case: the logger is already configured this way
+    #
+    if ioccc_logger and ioccc_logger_config == (log_type, logging_level):
+        return
 
     # create the logger, which will change the state
     #
@@ -5570,174 +6417,62 @@ def setup_logger(logtype, dbglvl) -> None:
         print(f'ERROR via print: logging.getLogger returned None for logtype: {logtype}')
         return
 
-    # case: logtype is "stdout"
-    #
-    # log to stdout
+    # setup the logging handler, unless we formed it before
     #
-    if logtype.lower() == "stdout":
-
-        # set logging format
-        #
-        formatter = logging.Formatter(
-                        '%(asctime)s.%(msecs)03d: %(name)s: %(levelname)s: %(message)s',
-                        datefmt='%Y-%m-%d %H:%M:%S')
+    log_handler = ioccc_log_handlers.get((log_type, logging_level))
+    if not log_handler:
 
-        # setup stdout logging handler
+        # case: logtype is "stdout"
         #
-        stdout_handler = logging.StreamHandler(sys.stdout)
-        stdout_handler.setLevel(logging_level)
-        stdout_handler.setFormatter(formatter)
-
-        # configure the logger
-        #
-        # There is BUG in logging where logging requires
-        # an additional call to the logging.basicConfig function.
-        #
-        # To avoid duplicate messages, we do not call:
-        #
-        #   my_logger.addHandler(stdout_handler)
+        # log to stdout
         #
-        logging.basicConfig(level=logging_level, handlers=[stdout_handler])
+        if log_type == "stdout":
+            log_handler = logging.StreamHandler(sys.stdout)
 
-    # case: logtype is "stderr"
-    #
-    # log to stderr
-    #
-    if logtype.lower() == "stderr":
-
-        # set logging format
+        # case: logtype is "stderr"
         #
-        formatter = logging.Formatter(
-                        '%(asctime)s.%(msecs)03d: %(name)s: %(levelname)s: %(message)s',
-                        datefmt='%Y-%m-%d %H:%M:%S')
-
-        # setup stderr logging handler
+        # log to stderr
         #
-        stderr_handler = logging.StreamHandler(sys.stderr)
-        stderr_handler.setLevel(logging_level)
-        stderr_handler.setFormatter(formatter)
+        elif log_type == "stderr":
+            log_handler = logging.StreamHandler(sys.stderr)
 
-        # configure the logger
+        # case: logtype is "syslog"
         #
-        # There is BUG in logging where logging requires
-        # an additional call to the logging.basicConfig function.
+        # log via syslog local5 facility
         #
-        # To avoid duplicate messages, we do not call:
-        #
-        #   my_logger.addHandler(stderr_handler)
-        #
-        logging.basicConfig(level=logging_level, handlers=[stderr_handler])
+        else:
+            log_handler = SysLogHandler(address = return_syslog_address(),
+                                        facility = SysLogHandler.LOG_LOCAL5)
+        log_handler.setLevel(logging_level)
+        log_handler.setFormatter(IOCCC_LOG_FORMATTER)
+        ioccc_log_handlers[(log_type, logging_level)] = log_handler
 
-    # case: logtype is "syslog"
+    # configure the logger
     #
-    # log via syslog local5 facility
+    # There is BUG in logging where logging requires
+    # an additional call to the logging.basicConfig function.
     #
-    if logtype.lower() == "syslog":
-
-        # set logging format
-        #
-        formatter = logging.Formatter(
-                        '%(asctime)s.%(msecs)03d: %(name)s: %(levelname)s: %(message)s',
-                        datefmt='%Y-%m-%d %H:%M:%S')
-
-        # determine the logging address
-        #
-        log_address = None
-        try:
-            if Path("/var/run/syslog").exists():
-
-                # macOS
-                #
-                log_address = "/var/run/syslog"
-
-            elif Path("/run/systemd/journal/dev-log").exists():
-
-                # Linux and related friends
-                #
-                log_address = "/run/systemd/journal/dev-log"
-
-            elif Path("/dev/log").exists():
-
-                # Linux and related friends symlink
-                #
-                log_address = "/dev/log"
-
-            elif Path("/var/run/log").exists():
-
-                # FreeBSD and NetBSD and related friends
-                #
-                log_address = "/var/run/log"
-
-        # Do not use: except OSError as errcode: because we have no easy way to report the errcode
-        #
-        except OSError:
-            pass
-
-        if not log_address:
-
-            # log access is unknown - use /dev/null
-            #
-            log_address = "/dev/null"
-
-        # setup the syslog handler
-        #
-        syslog_handler = SysLogHandler(address = log_address,
-                                       facility = SysLogHandler.LOG_LOCAL5)
-        syslog_handler.setLevel(logging_level)
-        syslog_handler.setFormatter(formatter)
-
-        # add the file logging handler to the logger
-        #
-        # To avoid duplicate messages, we do not call:
-        #
-        #   my_logger.addHandler(syslog_handler)
-        #
-        logging.basicConfig(level=logging_level, handlers=[syslog_handler])
-
-    # more paranoia
+    # To avoid duplicate messages, we do not call:
     #
-    if not my_logger:
-        print(f'ERROR via print: about to return with a None my_logger for logtype: {logtype}')
-        return
+    #   my_logger.addHandler(log_handler)
+    #
+    logging.basicConfig(level=logging_level, handlers=[log_handler])
 
     # save the newly configured logger
     #
-    debug(f'{me}: end: configured logger')
-    ioccc_logger = my_logger
-#
-# pylint: enable=too-many-branches
-# pylint: enable=too-many-statements
-
-
-def debug(msg, *args, **kwargs):
-    """
-    Write a DEBUG message or not depending on ioccc_logger
-
-    If not ioccc_logger, then
-        do not log (do nothing),
-    else
-        Use ioccc_logger as a logging facility that was setup  by setup_logger(Bool)
-    """
-
-    # setup
+    # NOTE: We already checked my_logger above, and nothing since has changed it.
     #
-    # pylint: disable-next=global-statement
-    global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    # We do NOT want to call debug start from this function because of recursion
-    #no# debug(f'{me}: start')
-
-    if ioccc_logger:
-        try:
-            ioccc_logger.debug(msg, *args, **kwargs)
-
-        except OSError as errcode:
-            ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.debug failed, failed: <<{errcode}>>'
+    ioccc_logger = my_logger
+    ioccc_logger_config = (log_type, logging_level)
+    debug('%s: end: configured logger', me)
+#
+# pylint: enable=too-many-branches
+# pylint: enable=too-many-statements
 
 
-def dbg(msg, *args, **kwargs):
+def debug(msg, *args, **kwargs):
     """
-    Write a DEBUG message if we have called setup_logger to setup ioccc_logger.
+    Write a DEBUG message or not depending on ioccc_logger
 
     If not ioccc_logger, then
         do not log (do nothing),
@@ -5747,11 +6482,22 @@ def dbg(msg, *args, **kwargs):
 
     # setup
     #
-    # We do NOT want to call debug start from this function because this function does the debug setup
-    #no# me = inspect.currentframe().f_code.co_name
+    # pylint: disable-next=global-statement
+    global ioccc_last_errmsg
+    me = 'debug'
+    # We do NOT want to call debug start from this function because of recursion
     #no# debug(f'{me}: start')
 
-    debug(msg, *args, **kwargs)
+    # case: no logging, or debug messages are not logged
+    #
+    if not ioccc_logger or not ioccc_logger.isEnabledFor(logging.DEBUG):
+        return
+
+    try:
+        ioccc_logger.debug(msg, *args, **kwargs)
+
+    except OSError as errcode:
+        ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.debug failed, failed: <<{errcode}>>'
 
 
 def info(msg, *args, **kwargs):
@@ -5768,18 +6514,20 @@ def info(msg, *args, **kwargs):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    # pylint: disable-next=global-statement,global-variable-not-assigned
-    global ioccc_logger
-    me = inspect.currentframe().f_code.co_name
+    me = 'info'
     # We do NOT want to call debug start from this function because of recursion
     #no# debug(f'{me}: start')
 
-    if ioccc_logger:
-        try:
-            ioccc_logger.info(msg, *args, **kwargs)
+    # case: no logging
+    #
+    if not ioccc_logger:
+        return
 
-        except OSError as errcode:
-            ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.info failed, failed: <<{errcode}>>'
+    try:
+        ioccc_logger.info(msg, *args, **kwargs)
+
+    except OSError as errcode:
+        ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.info failed, failed: <<{errcode}>>'
 
 
 def warning(msg, *args, **kwargs):
@@ -5796,35 +6544,20 @@ def warning(msg, *args, **kwargs):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
+    me = 'warning'
     # We do NOT want to call debug start from this function because of recursion
     #no# debug(f'{me}: start')
 
-    if ioccc_logger:
-        try:
-            ioccc_logger.warning(msg, *args, **kwargs)
-
-        except OSError as errcode:
-            ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.warning failed, failed: <<{errcode}>>'
-
-
-def warn(msg, *args, **kwargs):
-    """
-    Write a WARNING message if we have called setup_logger to setup ioccc_logger.
-
-    If not ioccc_logger, then
-        do not log (do nothing),
-    else
-        Use ioccc_logger as a logging facility that was setup  by setup_logger(Bool)
-    """
-
-    # setup
+    # case: no logging
     #
-    # We do NOT want to call debug start from this function because this function does the debug setup
-    #no# me = inspect.currentframe().f_code.co_name
-    #no# debug(f'{me}: start')
+    if not ioccc_logger:
+        return
+
+    try:
+        ioccc_logger.warning(msg, *args, **kwargs)
 
-    warning(msg, *args, **kwargs)
+    except OSError as errcode:
+        ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.warning failed, failed: <<{errcode}>>'
 
 
 def error(msg, *args, **kwargs):
@@ -5841,23 +6574,61 @@ def error(msg, *args, **kwargs):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
+    me = 'error'
     # We do NOT want to call debug start from this function because of recursion
     #no# debug(f'{me}: start')
 
-    if ioccc_logger:
-        try:
-            ioccc_logger.error(msg, *args, **kwargs)
+    # case: no logging
+    #
+    if not ioccc_logger:
+        return
 
-        except OSError as errcode:
-            ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.error failed, failed: <<{errcode}>>'
+    try:
+        ioccc_logger.error(msg, *args, **kwargs)
+
+    except OSError as errcode:
+        ioccc_last_errmsg = f'ERROR: {me}: ioccc_logger.error failed, failed: <<{errcode}>>'
+
+
+# dbg() and warn() are aliases of debug() and warning()
+#
+# NOTE: As aliases rather than functions that call debug() or warning(),
+#       dbg() and warn() do not add a function call to every log message.
+#
+dbg = debug
+warn = warning
 
 
-def sha256_file(filename):
+def sha256_file(filename, file_stat=None):
     """
     Compute the SHA256 hash as a ASCII HEX digest string.
 
-    We compute the SHA256 hash in an efficient way, for Python 3 version < 3.11.
+    See sha256_file_length() for details.
+
+    Given:
+        filename    path to a file to SHA256 hash
+        file_stat   os.stat() of filename already obtained by the caller, or None
+
+    Returns:
+        None ==> filename does not exist, or
+                 filename is not readable, or
+                 unable to SHA256 hash the filename
+        != None ==> SHA256 hash as a ASCII HEX digest string
+
+    WARNING: This function does NOT lock.  The caller should lock as needed.
+    """
+
+    # SHA256 hash the file
+    #
+    hexdigest, _ = sha256_file_length(filename, file_stat)
+    return hexdigest
+
+
+def sha256_file_length(filename, file_stat=None):
+    """
+    Compute the SHA256 hash as a ASCII HEX digest string, and the length of the file.
+
+    We compute the SHA256 hash in an efficient way:
 
         - Avoid character encoding and line-ending conversion issues.
         - Sequentially read it block by block and update the hash for each block.
@@ -5868,14 +6639,22 @@ def sha256_file(filename):
 
         https://stackoverflow.com/a/44873382/27339496
 
+    While we read the file, we count the bytes we hash.  Thus the caller need not
+    stat the file to obtain the length of what was hashed.
+
     Given:
         filename    path to a file to SHA256 hash
+        file_stat   os.stat() of filename already obtained by the caller, or None
+
+        NOTE: When file_stat is given, it is used to look for an already computed
+              SHA256 hash instead of calling os.stat() again.
 
     Returns:
-        None ==> filename does not exist, or
-                 filename is not readable, or
-                 unable to SHA256 hash the filename
-        != None ==> SHA256 hash as a ASCII HEX digest string
+        None, None ==> filename does not exist, or
+                       filename is not readable, or
+                       unable to SHA256 hash the filename
+        != None, length ==> SHA256 hash as a ASCII HEX digest string, and
+                            the number of bytes hashed
 
     NOTE: This code assumes Python versions < 3.8 or later
           due to the assignment expression.  See the above URL
@@ -5888,41 +6667,87 @@ def sha256_file(filename):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'sha256_file_length'
+    debug('%s: start', me)
 
     # paranoia - if we don't have an ip address string
     #
     if not isinstance(filename, str):
-        error(f'{me}: filename value is not a string')
-        return None
+        error('%s: filename value is not a string', me)
+        return None, None
 
-    # prep to SHA256 hash
+    # case: we have already hashed this unchanged file
+    #
+    try:
+        if not isinstance(file_stat, os.stat_result):
+            file_stat = os.stat(filename)
+        sha256_key = (filename, file_stat.st_mtime_ns, file_stat.st_ctime_ns, file_stat.st_size, file_stat.st_ino)
+        with ioccc_sha256_cache_lock:
+            cached = ioccc_sha256_cache.get(sha256_key)
+            if cached:
+                ioccc_sha256_cache.move_to_end(sha256_key)
+        if cached:
+            debug('%s: end: cached SHA256: %s length: %s', me, cached[0], cached[1])
+            return cached
+
+    # Do not use: except OSError as errcode: because we will report the error when we open below
     #
-    h  = hashlib.sha256()
-    b  = bytearray(SHA25_BUFSIZE)
-    mv = memoryview(b)
+    except OSError:
+        pass
 
     # SHA256 hash is chunks
     #
+    # We hash block by block into the SHA25_BUFSIZE buffer of this thread.  Only the final
+    # block is normally short, so we hash the full buffer without slicing the memoryview
+    # whenever readinto() filled it.
+    #
     try:
         with open(filename, 'rb', buffering=0) as f:
+
+            # note the key of the file we are about to hash
+            #
+            file_stat = os.fstat(f.fileno())
+            sha256_key = (filename, file_stat.st_mtime_ns, file_stat.st_ctime_ns, file_stat.st_size, file_stat.st_ino)
+
+            # hint that we will read the file sequentially, where supported
+            #
+            if HAVE_POSIX_FADVISE:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            # hash the file
+            #
+            h  = hashlib.sha256()
+            mv = getattr(IOCCC_SHA256_POOL, 'mv', None)
+            if mv is None:
+                mv = memoryview(bytearray(SHA25_BUFSIZE))
+                IOCCC_SHA256_POOL.mv = mv
+            length = 0
             while n := f.readinto(mv):
-                h.update(mv[:n])
+                h.update(mv if n == SHA25_BUFSIZE else mv[:n])
+                length += n
 
     except OSError as errcode:
         ioccc_last_errmsg = f'Warning: {me}: cannot open file: {filename} for SHA256 hashing failed: <<{errcode}>>'
-        warning(f'{me}: open for reading {filename} failed: <<{errcode}>>')
+        warning('%s: open for reading %s failed: <<%s>>', me, filename, errcode)
 
         # we have no JSON to return
         #
-        return None
+        return None, None
 
-    # return SHA256 hash ASCII HEX digest string
+    # remember the SHA256 hash unless the file was recently modified
     #
     hexdigest = h.hexdigest()
-    debug(f'{me}: end: SHA256: {hexdigest}')
-    return hexdigest
+    if time.time_ns() - max(file_stat.st_mtime_ns, file_stat.st_ctime_ns) > SHA256_CACHE_SETTLE_SECS * 1000000000:
+        with ioccc_sha256_cache_lock:
+            ioccc_sha256_cache[sha256_key] = (hexdigest, length)
+            ioccc_sha256_cache.move_to_end(sha256_key)
+            while len(ioccc_sha256_cache) > SHA256_CACHE_MAX:
+                ioccc_sha256_cache.popitem(last=False)
+
+    # return SHA256 hash ASCII HEX digest string and length
+    #
+    debug('%s: end: SHA256: %s length: %s', me, hexdigest, length)
+    return hexdigest, length
 
 
 # pylint: disable=too-many-return-statements
@@ -5962,8 +6787,8 @@ def validate_slot_dict_nolock(slot_dict, username, slot_num):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'validate_slot_dict_nolock'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -5972,7 +6797,7 @@ def validate_slot_dict_nolock(slot_dict, username, slot_num):
         # The check_username_arg() function above will set ioccc_last_errmsg
         # and issue log messages due to a username firewall check failure.
         #
-        debug(f'{me}: end: invalid username arg')
+        debug('%s: end: invalid username arg', me)
         return 'invalid username arg'
 
     # firewall - canonical firewall checks on the slot_num arg
@@ -5982,63 +6807,69 @@ def validate_slot_dict_nolock(slot_dict, username, slot_num):
         # The check_slot_num_arg() function above will set ioccc_last_errmsg
         # and issue log messages due to a slot_num firewall check failure.
         #
-        debug(f'{me}: end: invalid slot_num arg')
+        debug('%s: end: invalid slot_num arg', me)
         return 'invalid slot_num arg'
 
     # validate args
     #
     if not isinstance(slot_dict, dict):
-        debug(f'{me}: end: slot_dict arg is not a python dictionary')
+        debug('%s: end: slot_dict arg is not a python dictionary', me)
         return 'slot_dict arg is not a python dictionary'
 
     # determine user directory path
     #
     user_dir = return_user_dir_path(username)
     if not user_dir:
-        debug(f'{me}: end: invalid username arg')
+        debug('%s: end: invalid username arg', me)
         return 'invalid username arg'
 
     # determine slot directory path
     #
     slot_dir = return_slot_dir_path(username, slot_num)
     if not slot_dir:
-        debug(f'{me}: end: invalid slot_num arg')
+        debug('%s: end: invalid slot_num arg', me)
         return 'invalid slot_num arg'
 
     # firewall check slot no_comment
     #
-    if not 'no_comment' in slot_dict:
-        debug(f'{me}: end: missing slot no_comment string')
+    # NOTE: Each slot value is looked up once with slot_dict.get(), where
+    #       MISSING_SLOT_VALUE indicates that the key is not in slot_dict.
+    #
+    value = slot_dict.get('no_comment', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot no_comment string', me)
         return 'missing slot no_comment string'
-    if not isinstance(slot_dict['no_comment'], str):
-        debug(f'{me}: end: slot no_comment is not a string')
+    if not isinstance(value, str):
+        debug('%s: end: slot no_comment is not a string', me)
         return 'slot no_comment is not a string'
-    if slot_dict['no_comment'] != NO_COMMENT_VALUE:
-        debug(f'{me}: end: invalid slot no_comment')
+    if value != NO_COMMENT_VALUE:
+        debug('%s: end: invalid slot no_comment', me)
         return 'invalid slot no_comment'
 
     # firewall check slot_JSON_format_version
     #
-    if not 'slot_JSON_format_version' in slot_dict:
-        debug(f'{me}: end: missing slot_JSON_format_version string')
+    value = slot_dict.get('slot_JSON_format_version', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot_JSON_format_version string', me)
         return 'missing slot_JSON_format_version string'
-    if not isinstance(slot_dict['slot_JSON_format_version'], str):
-        debug(f'{me}: end: slot_JSON_format_version is not a string')
+    if not isinstance(value, str):
+        debug('%s: end: slot_JSON_format_version is not a string', me)
         return 'slot_JSON_format_version is not a string'
-    if slot_dict['slot_JSON_format_version'] != SLOT_VERSION_VALUE:
-        debug(f'{me}: end: invalid slot_JSON_format_version')
+    if value != SLOT_VERSION_VALUE:
+        debug('%s: end: invalid slot_JSON_format_version', me)
         return 'invalid slot_JSON_format_version'
 
     # slot must have the correct slot number
     #
-    if not 'slot' in slot_dict:
-        debug(f'{me}: end: missing slot number')
+    value = slot_dict.get('slot', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot number', me)
         return 'missing slot number'
-    if not isinstance(slot_dict['slot'], int):
-        debug(f'{me}: end: slot number is not an int')
+    if not isinstance(value, int):
+        debug('%s: end: slot number is not an int', me)
         return 'slot number is not an int'
-    if slot_dict['slot'] != slot_num:
-        debug(f'{me}: end: wrong slot number')
+    if value != slot_num:
+        debug('%s: end: wrong slot number', me)
         return 'wrong slot number'
 
     # if we have a filename, then the filename must be a valid filename string
@@ -6047,102 +6878,126 @@ def validate_slot_dict_nolock(slot_dict, username, slot_num):
     filename_is_string = True
     if not submit_file:
         filename_is_string = False
+    #
+    # NOTE: We first match submit_file against the precompiled SUBMIT_FILENAME_PATTERN.
+    #       Only when that does not match do we determine which error to report.
+    #
     if filename_is_string:
-        if not submit_file.startswith('submit.'):
-            debug(f'{me}: end: slot filename does not begin with submit.')
+        submit_match = SUBMIT_FILENAME_PATTERN.match(submit_file)
+        if submit_match and submit_match.group(1) == username and submit_match.group(2) == str(slot_num):
+            pass
+        elif not submit_file.startswith('submit.'):
+            debug('%s: end: slot filename does not begin with submit.', me)
             return 'slot filename does not begin with submit.'
-        if not submit_file.startswith(f'submit.{username}-{slot_num}.'):
-            debug(f'{me}: end: slot filename does not begin with submit.{username}-{slot_num}.')
+        elif not submit_file.startswith(f'submit.{username}-{slot_num}.'):
+            debug('%s: end: slot filename does not begin with submit.%s-%s.', me, username, slot_num)
             return f'slot filename does not begin with submit.{username}-{slot_num}.'
-        if not submit_file.endswith('.txz'):
-            debug(f'{me}: end: slot filename does not end with .txz')
+        elif not submit_file.endswith('.txz'):
+            debug('%s: end: slot filename does not end with .txz', me)
             return 'slot filename does not end with .txz'
-        if not re.match(f'^submit\\.{username}-{slot_num}\\.[1-9][0-9]{{9,}}\\.txz$', submit_file):
-            debug(f'{me}: end: invalid slot filename timestamp')
+        else:
+            debug('%s: end: invalid slot filename timestamp', me)
             return 'invalid slot filename timestamp'
 
     # if we have a filename, then slot must have a valid slot length
     # otherwise we must not have a slot length
     #
-    if not 'length' in slot_dict:
-        debug(f'{me}: end: missing slot length int')
+    value = slot_dict.get('length', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot length int', me)
         return 'missing slot length int'
     if filename_is_string:
-        if not isinstance(slot_dict['length'], int):
-            debug(f'{me}: end: slot length is not an int')
+        if not isinstance(value, int):
+            debug('%s: end: slot length is not an int', me)
             return 'slot length is not an int'
-        if slot_dict['length'] < 0:
-            debug(f'{me}: end: slot length not >= 0')
+        if value < 0:
+            debug('%s: end: slot length not >= 0', me)
             return 'slot length not >= 0'
-    elif slot_dict['length']:
-        debug(f'{me}: end: have length w/o filename')
+    elif value:
+        debug('%s: end: have length w/o filename', me)
         return 'have length w/o filename'
 
     # if we have a filename, then slot must have a valid slot date
     # otherwise we must not have a slot date
     #
-    if not 'date' in slot_dict:
-        debug(f'{me}: end: missing slot date string')
+    value = slot_dict.get('date', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot date string', me)
         return 'missing slot date string'
     if filename_is_string:
-        if not isinstance(slot_dict['date'], str):
-            debug(f'{me}: end: slot date is not a string')
+        if not isinstance(value, str):
+            debug('%s: end: slot date is not a string', me)
             return 'slot date is not a string'
+        #
+        # NOTE: Slot dates are always written in the canonical DATETIME_USEC_FORMAT form,
+        #       so a date that does not fully match DATETIME_USEC_RE is rejected without
+        #       calling strptime().  A date that matches is then checked for a valid
+        #       calendar date and time by the much faster fromisoformat().
+        #
+        if not DATETIME_USEC_RE.fullmatch(value):
+            debug('%s: end: slot date format is invalid', me)
+            return 'slot date format is invalid'
         try:
             # pylint: disable-next=unused-variable
-            dt = datetime.datetime.strptime(slot_dict['date'], DATETIME_USEC_FORMAT)
+            dt = datetime.datetime.fromisoformat(value[:-4])
         # pylint: disable-next=unused-variable
         except ValueError as errcode:
-            debug(f'{me}: end: slot date format is invalid')
+            debug('%s: end: slot date format is invalid', me)
             return 'slot date format is invalid'
-    elif slot_dict['date']:
-        debug(f'{me}: end: have date w/o filename')
+    elif value:
+        debug('%s: end: have date w/o filename', me)
         return 'have date w/o filename'
 
     # if we have a filename, then slot must have a valid SHA256 hash
     # otherwise we must not have a slot SHA256 hash
     #
-    if not 'SHA256' in slot_dict:
-        debug(f'{me}: end: missing slot SHA256 string')
+    value = slot_dict.get('SHA256', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot SHA256 string', me)
         return 'missing slot SHA256 string'
     if filename_is_string:
-        if not isinstance(slot_dict['SHA256'], str):
-            debug(f'{me}: end: slot SHA256 is not a string')
+        if not isinstance(value, str):
+            debug('%s: end: slot SHA256 is not a string', me)
             return 'slot SHA256 is not a string'
-        if len(slot_dict['SHA256']) != SHA256_HEXLEN:
-            debug(f'{me}: end: slot SHA256 length is wrong')
-            return 'slot SHA256 length is wrong'
-    elif slot_dict['SHA256']:
-        debug(f'{me}: end: have SHA256 w/o filename')
+        if not SHA256_HEX_PATTERN.fullmatch(value):
+            if len(value) != SHA256_HEXLEN:
+                debug('%s: end: slot SHA256 length is wrong', me)
+                return 'slot SHA256 length is wrong'
+            debug('%s: end: slot SHA256 is not a lower case hex string', me)
+            return 'slot SHA256 is not a lower case hex string'
+    elif value:
+        debug('%s: end: have SHA256 w/o filename', me)
         return 'have SHA256 w/o filename'
 
     # slot must have a collected boolean
     #
-    if not 'collected' in slot_dict:
-        debug(f'{me}: end: missing slot collected boolean')
+    collected = slot_dict.get('collected', MISSING_SLOT_VALUE)
+    if collected is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot collected boolean', me)
         return 'missing slot collected boolean'
-    if not isinstance(slot_dict['collected'], bool):
-        debug(f'{me}: end: slot collected is not a boolean')
+    if not isinstance(collected, bool):
+        debug('%s: end: slot collected is not a boolean', me)
         return 'slot collected is not a boolean'
 
     # slot must have a status string
     #
-    if not 'status' in slot_dict:
-        debug(f'{me}: end: missing slot status string')
+    value = slot_dict.get('status', MISSING_SLOT_VALUE)
+    if value is MISSING_SLOT_VALUE:
+        debug('%s: end: missing slot status string', me)
         return 'missing slot status string'
-    if not isinstance(slot_dict['status'], str):
-        debug(f'{me}: end: slot status is not a string')
+    if not isinstance(value, str):
+        debug('%s: end: slot status is not a string', me)
         return 'slot status is not a string'
 
     # collected requires a filename to be string (what was previously collected)
     #
-    if not filename_is_string and slot_dict['collected']:
-        debug(f'{me}: end: submit file was collected w/o filename')
+    if not filename_is_string and collected:
+        debug('%s: end: submit file was collected w/o filename', me)
         return 'submit file was collected w/o filename'
 
     # no slot errors found
     #
-    debug(f'{me}: end: no slot errors found for username: {username} slot_num: {slot_num}')
+    debug('%s: end: no slot errors found for username: %s slot_num: %s', me, username, slot_num)
     return None
 #
 # pylint: enable=too-many-return-statements
@@ -6173,8 +7028,8 @@ def get_slot_dict_nolock(username, slot_num):
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'get_slot_dict_nolock'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -6198,24 +7053,23 @@ def get_slot_dict_nolock(username, slot_num):
     #
     slot_json_file = return_slot_json_filename(username, slot_num)
     if not slot_json_file:
-        error(f'{me}: return_slot_json_filename failed for username: {username} slot_num: {slot_num}')
+        error('%s: return_slot_json_filename failed for username: %s slot_num: %s', me, username, slot_num)
         return None
     slot_dict = read_json_file_nolock(slot_json_file)
     if not slot_dict:
-        error(f'{me}: read_json_file_nolock failed for username: {username} slot_num: {slot_num} '
-              f'slot_json_file: {slot_json_file}')
+        error('%s: read_json_file_nolock failed for username: %s slot_num: %s slot_json_file: %s',
+              me, username, slot_num, slot_json_file)
         return None
 
     # return slot information as a python dictionary
     #
-    debug(f'{me}: end: returning slot information')
+    debug('%s: end: returning slot information', me)
     return slot_dict
 #
 # pylint: enable=too-many-return-statements
 
 
 # pylint: disable=too-many-return-statements
-# pylint: disable=too-many-branches
 #
 def validate_slot_nolock(slot_dict, username, slot_num, submit_required, check_hash):
     """
@@ -6275,8 +7129,8 @@ def validate_slot_nolock(slot_dict, username, slot_num, submit_required, check_h
 
     # setup
     #
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'validate_slot_nolock'
+    debug('%s: start', me)
 
     # firewall - canonical firewall checks on the username arg
     #
@@ -6285,7 +7139,7 @@ def validate_slot_nolock(slot_dict, username, slot_num, submit_required, check_h
         # The check_username_arg() function above will set ioccc_last_errmsg
         # and issue log messages due to a username firewall check failure.
         #
-        debug(f'{me}: end: invalid username arg')
+        debug('%s: end: invalid username arg', me)
         return 'invalid username arg'
 
     # firewall - canonical firewall checks on the slot_num arg
@@ -6295,34 +7149,85 @@ def validate_slot_nolock(slot_dict, username, slot_num, submit_required, check_h
         # The check_slot_num_arg() function above will set ioccc_last_errmsg
         # and issue log messages due to a slot_num firewall check failure.
         #
-        debug(f'{me}: end: invalid slot_num arg')
+        debug('%s: end: invalid slot_num arg', me)
         return 'invalid slot_num arg'
 
     # validate boolean args
     #
     if not isinstance(slot_dict, dict):
-        debug(f'{me}: end: slot_dict arg is not a python dictionary')
+        debug('%s: end: slot_dict arg is not a python dictionary', me)
         return 'slot_dict arg is not a python dictionary'
     if not isinstance(submit_required, bool):
-        debug(f'{me}: end: submit_required arg is not a boolean')
+        debug('%s: end: submit_required arg is not a boolean', me)
         return 'submit_required arg is not a boolean'
     if not isinstance(check_hash, bool):
-        debug(f'{me}: end: submit_required arg is not a boolean')
+        debug('%s: end: submit_required arg is not a boolean', me)
         return 'check_hash arg is not a boolean'
 
     # validate username
     #
     if not lookup_username(username):
-        debug(f'{me}: end: lookup_username failed')
+        debug('%s: end: lookup_username failed', me)
         return 'no such username'
 
     # determine slot directory path
     #
     slot_dir = return_slot_dir_path(username, slot_num)
     if not slot_dir:
-        debug(f'{me}: end: return_slot_dir_path failed')
+        debug('%s: end: return_slot_dir_path failed', me)
         return 'return_slot_dir_path failed'
 
+    # validate the slot
+    #
+    # NOTE: We have performed the canonical firewall checks on the username and slot_num args,
+    #       and verified that the username is a valid user.
+    #
+    slot_error = validate_slot_nocheck(slot_dict, username, slot_num, slot_dir, submit_required, check_hash)
+    debug('%s: end', me)
+    return slot_error
+#
+# pylint: enable=too-many-return-statements
+
+
+# pylint: disable=too-many-return-statements
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+#
+def validate_slot_nocheck(slot_dict, username, slot_num, slot_dir, submit_required, check_hash):
+    """
+    Validate a slot, without the canonical firewall checks on the args
+
+    This function is the same as validate_slot_nolock(slot_dict, username, slot_num,
+    submit_required, check_hash) except that it assumes that the caller has already
+    performed the canonical firewall checks on the username and slot_num args,
+    verified that the username is a valid user, and determined the slot directory path.
+
+    Given:
+        slot_dict       slot JSON content as a python dictionary
+        username        IOCCC submit server username
+        slot_num        slot number for a given username
+        slot_dir        slot directory path for the username and slot_num
+        submit_required   True ==> submit file must exist
+                          False ==> submit file may or may not exist
+        check_hash      True ==> check the SHA256 hash of the submit file, if it exists
+                        False ==> do not check the SHA256 hash
+
+    Returns:
+        None ==> no errors detected with the slot
+        != None ==> slot error string
+
+    WARNING: The caller must have already called check_username_arg(username, parent)
+             and check_slot_num_arg(slot_num) with success.
+
+    WARNING: This function does NOT lock.  The caller should lock as needed.
+    """
+
+    # setup
+    #
+    me = 'validate_slot_nocheck'
+    debug('%s: start', me)
+
     # validate JSON slot contents
     #
     # NOTE: This call to validate_slot_dict_nolock(), if does NOT return an error
@@ -6331,94 +7236,124 @@ def validate_slot_nolock(slot_dict, username, slot_num, submit_required, check_h
     #
     slot_error = validate_slot_dict_nolock(slot_dict, username, slot_num)
     if isinstance(slot_error, str):
-        debug(f'{me}: end: slot_error: <<{slot_error}>>')
+        debug('%s: end: slot_error: <<%s>>', me, slot_error)
         return slot_error
 
     # determine full path of submit file
     #
-    submit_path = return_submit_path(slot_dict, username, slot_num)
+    # NOTE: The args were checked by the caller and slot_dict was checked above, and we
+    #       were given slot_dir, so we form the submit path directly instead of calling
+    #       return_submit_path() which would repeat the firewall checks and form slot_dir again.
+    #
+    submit_file = slot_dict.get('filename')
+    if submit_file and isinstance(submit_file, str):
+        submit_path = f'{slot_dir}/{submit_file}'
+    else:
+        submit_path = None
 
     # case: filename is a string
     #
     if isinstance(submit_path, str):
 
-        # case: submit file is a file
+        # stat the submit file
+        #
+        # NOTE: We use a single os.stat() call to determine if the submit file is a file,
+        #       and the length of the submit file, instead of both Path().is_file() and
+        #       os.path.getsize().
         #
         try:
-            if Path(submit_path).is_file():
+            submit_stat = os.stat(submit_path)
 
-                # if check_hash, also check the SHA256 hash
-                #
-                if check_hash:
+        # case: the submit file does not exist
+        #
+        except (FileNotFoundError, NotADirectoryError):
+            submit_stat = None
 
-                    # verify the SHA256 hash of the submit file
-                    #
-                    sha256 = sha256_file(submit_path)
-                    if not sha256:
-                        debug(f'{me}: end: submit file SHA256 hash failed')
-                        return 'submit file SHA256 hash failed'
+        # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+        #
+        except OSError:
+            debug('%s: end: cannot determine if the submit file is a file', me)
+            return 'cannot determine if the submit file is a file'
 
-                    # verify the content of the submit file
-                    #
-                    if sha256 != slot_dict['SHA256']:
-                        debug(f'{me}: end: submit file corrupted contents')
-                        return 'submit file corrupted contents'
+        # case: submit file is a file
+        #
+        if submit_stat and stat.S_ISREG(submit_stat.st_mode):
 
-                # verify that the submit file has not been collected
-                #
-                if slot_dict['collected']:
-                    debug(f'{me}: end: submit file collected but still exists')
-                    return 'submit file collected but still exists'
+            # verify that the submit file has not been collected
+            #
+            if slot_dict['collected']:
+                debug('%s: end: submit file collected but still exists', me)
+                return 'submit file collected but still exists'
 
-                # verify that the submit file length matches the length
-                #
-                if os.path.getsize(submit_path) != slot_dict['length']:
-                    debug(f'{me}: end: submit file length is wrong')
-                    return 'submit file length is wrong'
+            # verify that the submit file length matches the length
+            #
+            if submit_stat.st_size != slot_dict['length']:
+                debug('%s: end: submit file length is wrong', me)
+                return 'submit file length is wrong'
 
-            # case: submit file does not exist but is required to do so
+            # if check_hash, also check the SHA256 hash
+            #
+            # NOTE: We check the SHA256 hash last, after the above checks that only
+            #       need the slot and the os.stat() result, so that we do not read
+            #       and hash the submit file of a slot that is already known to be bad.
             #
-            elif submit_required:
+            if check_hash:
 
-                # if file is required, verify that submit file exists
+                # verify the SHA256 hash of the submit file
                 #
-                debug(f'{me}: end: submit file is missing')
-                return 'submit file is missing'
-
-            # case: submit file does not exist and was never collected
-            #
-            elif not slot_dict['collected']:
+                # NOTE: We pass the above os.stat() result so that an unchanged submit file
+                #       that was already hashed is not read or even stat-ed again.
+                #
+                sha256 = sha256_file(submit_path, submit_stat)
+                if not sha256:
+                    debug('%s: end: submit file SHA256 hash failed', me)
+                    return 'submit file SHA256 hash failed'
 
-                # submit file is gone but was never collected
+                # verify the content of the submit file
                 #
-                debug(f'{me}: end: submit file is gone but not collected')
-                return 'submit file is gone but not collected'
+                if sha256 != slot_dict['SHA256']:
+                    debug('%s: end: submit file corrupted contents', me)
+                    return 'submit file corrupted contents'
 
-        # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+        # case: submit file does not exist but is required to do so
         #
-        except OSError:
-            debug(f'{me}: end: cannot determine if the submit file is a file')
-            return 'cannot determine if the submit file is a file'
+        elif submit_required:
+
+            # if file is required, verify that submit file exists
+            #
+            debug('%s: end: submit file is missing', me)
+            return 'submit file is missing'
+
+        # case: submit file does not exist and was never collected
+        #
+        elif not slot_dict['collected']:
+
+            # submit file is gone but was never collected
+            #
+            debug('%s: end: submit file is gone but not collected', me)
+            return 'submit file is gone but not collected'
 
     # case: filename is not a string, but a submit file is required
     #
     elif submit_required:
-        debug(f'{me}: end: submit file is expected to exist but does not')
+        debug('%s: end: submit file is expected to exist but does not', me)
         return 'submit file is expected to exist but does not'
 
     # case: filename is not a string, submit file is not required
     #
     elif slot_dict['collected']:
-        debug(f'{me}: end: submit file was collected w/o filename')
+        debug('%s: end: submit file was collected w/o filename', me)
         return 'submit file was collected w/o filename'
 
     # no slot errors found
     #
-    debug(f'{me}: end: no slot errors found')
+    debug('%s: end: no slot errors found', me)
     return None
 #
 # pylint: enable=too-many-return-statements
 # pylint: enable=too-many-branches
+# pylint: enable=too-many-positional-arguments
+# pylint: enable=too-many-arguments
 
 
 def move_unexpected_nolock(slot_dir):
@@ -6447,30 +7382,47 @@ def move_unexpected_nolock(slot_dir):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'move_unexpected_nolock'
+    debug('%s: start', me)
 
     # firewall - slot_dir arg must be a string
     #
     if not isinstance(slot_dir, str):
         ioccc_last_errmsg = f'ERROR: {me}: topdir arg is not a string'
-        error(f'{me}: topdir arg is not a string')
+        error('%s: topdir arg is not a string', me)
         return 0
 
+    # find the submit.*.txz files in slot_dir
+    #
+    # NOTE: We read slot_dir once with os.listdir() and match the names directly,
+    #       instead of glob.glob() translating the submit.*.txz pattern into a
+    #       regular expression on every call.  Like glob.glob(), an unreadable
+    #       or missing slot_dir has no submit.*.txz files to move.
+    #
+    try:
+        submit_files = [name for name in os.listdir(slot_dir)
+                        if name.startswith('submit.') and name.endswith('.txz') and len(name) >= len('submit..txz')]
+
+    # Do not use: except OSError as errcode: because we have no easy way to report the errcode
+    #
+    except OSError:
+        submit_files = []
+
     # move submit.*.txz files into UNEXPECTED_DIR
     #
     count = 0
-    for file in glob.glob(f'{slot_dir}/submit.*.txz'):
+    for name in submit_files:
+        file = f'{slot_dir}/{name}'
         count += 1
         try:
             shutil.move(file, UNEXPECTED_DIR)
-            warning(f'{me}: moved unexpected submit file: mv {file} {UNEXPECTED_DIR}')
+            warning('%s: moved unexpected submit file: mv %s %s', me, file, UNEXPECTED_DIR)
         except OSError as errcode:
             ioccc_last_errmsg = f'ERROR: {me}: {file} {UNEXPECTED_DIR} failed: <<{errcode}>>'
-            error(f'{me}: mv {file} {UNEXPECTED_DIR} failed: <<{errcode}>>')
+            error('%s: mv %s %s failed: <<%s>>', me, file, UNEXPECTED_DIR, errcode)
             return 0
 
-    debug(f'{me}: end: moved {count} unexpected files')
+    debug('%s: end: moved %s unexpected files', me, count)
     return count
 
 
@@ -6515,18 +7467,21 @@ def stage_submit(username, slot_num):
     #
     # pylint: disable-next=global-statement
     global ioccc_last_errmsg
-    me = inspect.currentframe().f_code.co_name
-    debug(f'{me}: start')
+    me = 'stage_submit'
+    debug('%s: start', me)
 
-    # firewall - canonical firewall checks on the username arg
+    # firewall - resolve the username into the user directory path
     #
-    if not check_username_arg(username, me):
+    # NOTE: The resolve_user() function also verifies that the user is a valid user.
+    #
+    resolved = resolve_user(username, me)
+    if not resolved:
 
-        # The check_username_arg() function above will set ioccc_last_errmsg
-        # and issue log messages due to a username firewall check failure.
+        # The resolve_user() function above will issue log messages
+        # due to a username check failure.
         #
-        ioccc_last_errmsg = f'ERROR: {me} invalid username arg'
-        error(f'{me} invalid username arg')
+        ioccc_last_errmsg = f'ERROR: {me} invalid or unknown username: {username}'
+        error('%s invalid or unknown username: %s', me, username)
         return None, '.', 0
 
     # firewall - canonical firewall checks on the slot_num arg
@@ -6537,100 +7492,112 @@ def stage_submit(username, slot_num):
         # and issue log messages due to a slot_num firewall check failure.
         #
         ioccc_last_errmsg = f'ERROR: {me} invalid slot_num arg'
-        error(f'{me} invalid slot_num arg')
-        return None, '.', 0
-
-    # look up username to be sure it is in the password database
-    #
-    if not lookup_username(username):
-        ioccc_last_errmsg = f'ERROR: {me} unknown username: {username}'
-        error(f'{me} unknown username: {username}')
+        error('%s invalid slot_num arg', me)
         return None, '.', 0
 
     # determine slot directory path
     #
-    slot_dir = return_slot_dir_path(username, slot_num)
-    if not slot_dir:
-        ioccc_last_errmsg = (f'ERROR: {me} return_slot_dir_path failed for '
-                             f'username: {username} slot_num: {slot_num}')
-        error(f'{me} return_slot_dir_path failed for username: {username} slot_num: {slot_num}')
-        return None, '.', 0
+    # NOTE: We have already performed the firewall checks on the username and slot_num args
+    #       that return_slot_dir_path() would perform.
+    #
+    slot_dir = f'{resolved[0]}/{slot_num}'
 
     # Lock the slot
     #
     # This will create the lock file if needed.
     #
-    slot_lock_fd = lock_slot(username, slot_num)
-    if not slot_lock_fd:
-        ioccc_last_errmsg = f'ERROR: {me} lock_slot failed for username: {username} slot_num: {slot_num}'
-        error(f'{me} lock_slot failed for username: {username} slot_num: {slot_num}')
-        return None, '.', 0
-
-    # obtain path of the submit filename
+    # NOTE: The slot is unlocked when we leave the with block, including when we return early.
     #
-    slot_dict = get_slot_dict_nolock(username, slot_num)
-    if not slot_dict:
-        # caller will log the error
-        unexpected_count = move_unexpected_nolock(slot_dir)
-        unlock_slot()
-        return None, '.', unexpected_count
+    with slot_lock_nocheck(username, slot_num) as slot_locked:
+        if not slot_locked:
+            ioccc_last_errmsg = f'ERROR: {me} lock_slot failed for username: {username} slot_num: {slot_num}'
+            error('%s lock_slot failed for username: %s slot_num: %s', me, username, slot_num)
+            return None, '.', 0
 
-    # validate the slot
-    #
-    slot_err = validate_slot_nolock(slot_dict, username, slot_num, True, True)
-    if isinstance(slot_err, str):
-        ioccc_last_errmsg = (f'ERROR: {me}: slot invalid for username: {username} slot_num: {slot_num} '
-                             f'slot_dir: {slot_dir} slot error: {slot_err}')
-        error(f'{me}: slot invalid for username: {username} slot_num: {slot_num} '
-              f'slot_dir: {slot_dir} slot error: {slot_err}')
-        unexpected_count = move_unexpected_nolock(slot_dir)
-        unlock_slot()
-        return None, '.', unexpected_count
+        # obtain path of the submit filename
+        #
+        slot_dict = get_slot_dict_nolock(username, slot_num)
+        if not slot_dict:
+            # caller will log the error
+            unexpected_count = move_unexpected_nolock(slot_dir)
+            return None, '.', unexpected_count
 
-    # determine full path of submit file and the basename of the submit file
-    #
-    submit_path = return_submit_path(slot_dict, username, slot_num)
-    if not isinstance(submit_path, str):
-        # caller will log the error
-        unexpected_count = move_unexpected_nolock(slot_dir)
-        unlock_slot()
-        return None, '.', unexpected_count
-    submit_file = os.path.basename(submit_path)
+        # validate the slot
+        #
+        # NOTE: We have already performed the canonical firewall checks on the username
+        #       and slot_num args, and verified that the username is a valid user.
+        #
+        slot_err = validate_slot_nocheck(slot_dict, username, slot_num, slot_dir, True, True)
+        if isinstance(slot_err, str):
+            ioccc_last_errmsg = (f'ERROR: {me}: slot invalid for username: {username} slot_num: {slot_num} '
+                                 f'slot_dir: {slot_dir} slot error: {slot_err}')
+            error('%s: slot invalid for username: %s slot_num: %s slot_dir: %s slot error: %s',
+                  me, username, slot_num, slot_dir, slot_err)
+            unexpected_count = move_unexpected_nolock(slot_dir)
+            return None, '.', unexpected_count
+
+        # determine the basename of the submit file and the full path of submit file
+        #
+        # NOTE: validate_slot_nocheck() above, with submit_required True, has verified that the
+        #       slot has a submit filename, so we form each path once from that filename
+        #       instead of calling return_submit_path() and then os.path.basename().
+        #
+        submit_file = slot_dict['filename']
+        submit_path = f'{slot_dir}/{submit_file}'
 
-    # move the submit file to the good directory
-    #
-    staged_path = f'{STAGED_DIR}/{submit_file}'
-    try:
-        os.replace(submit_path, staged_path)
-    except OSError as errcode:
-        ioccc_last_errmsg = (f'ERROR: {me}: replace {submit_path} {staged_path} for '
-                             f'failed: <<{errcode}>>')
-        error(f'{me}: replace {submit_path} {staged_path} for '
-              f'failed: <<{errcode}>>')
+        # move the submit file to the good directory
+        #
+        staged_path = f'{STAGED_DIR}/{submit_file}'
+        try:
+            os.replace(submit_path, staged_path)
+        except OSError as errcode:
+            ioccc_last_errmsg = (f'ERROR: {me}: replace {submit_path} {staged_path} for '
+                                 f'failed: <<{errcode}>>')
+            error('%s: replace %s %s for failed: <<%s>>', me, submit_path, staged_path, errcode)
+            unexpected_count = move_unexpected_nolock(slot_dir)
+            return None, '.', unexpected_count
+
+        # mark slot file as having been collected
+        #
+        slot_dict['collected'] = True
+        slot_dict['status'] = SLOT_STATUS_STAGED
+
+        # update the slot JSON file
+        #
+        # this call to write_slot_json_nolock() will log an error if there is a problem
+        write_slot_json_nolock(f'{slot_dir}/slot.json', slot_dict)
+
+        # all is well, note the SHA256 hash
+        #
+        # NOTE: We leave the with block, and so unlock the slot, as soon as the slot
+        #       is no longer being changed.
+        #
+        hexdigest = slot_dict['SHA256']
         unexpected_count = move_unexpected_nolock(slot_dir)
-        unlock_slot()
-        return None, '.', unexpected_count
 
-    # mark slot file as having been collected
+    # advise that the staged submit file need not remain in the page cache
     #
-    slot_dict['collected'] = True
-    slot_dict['status'] = 'successfully moved submit file into the staging area'
-
-    # update the slot JSON file
+    # The submit file may have just been read to verify its SHA256 hash, and this process will
+    # not read it again.  Where supported, we let the kernel release those pages now
+    # rather than keep them until there is memory pressure.
     #
-    # this call to return_slot_json_filename() will log an error if there is a problem
-    slot_json_file = return_slot_json_filename(username, slot_num)
-    if isinstance(slot_json_file, str):
-        # this call to write_slot_json_nolock() will log an error if there is a problem
-        write_slot_json_nolock(slot_json_file, slot_dict)
+    if HAVE_POSIX_FADVISE:
+        try:
+            staged_fd = os.open(staged_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(staged_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(staged_fd)
+
+        # Do not use: except OSError as errcode: because this advice is optional
+        #
+        except OSError:
+            pass
 
-    # all is well, return the SHA256 hash
+    # return the SHA256 hash
     #
-    hexdigest = slot_dict['SHA256']
-    unexpected_count = move_unexpected_nolock(slot_dir)
-    debug(f'{me}: end: returning SHA256: {hexdigest} staged_path: {staged_path} '
-          f'unexpected_count: {unexpected_count} for username: {username} slot_num: {slot_num}')
-    unlock_slot()
+    debug('%s: end: returning SHA256: %s staged_path: %s unexpected_count: %s for username: %s slot_num: %s',
+          me, hexdigest, staged_path, unexpected_count, username, slot_num)
     return hexdigest, staged_path, unexpected_count
 #
 # pylint: enable=too-many-return-statements
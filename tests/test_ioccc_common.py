@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+#
+# test_ioccc_common.py - tests for the caches of iocccsubmit.ioccc_common
+
+"""
+test_ioccc_common.py - tests for the caches of iocccsubmit.ioccc_common
+
+Each test runs against a private copy of the app directory so that
+the files of the installed IOCCC submit server are never touched.
+"""
+
+
+# system imports
+#
+import os
+import shutil
+
+
+# 3rd party imports
+#
+import pytest
+
+
+# import the ioccc python utility code
+#
+from iocccsubmit import ioccc_common
+
+
+# test users found in etc/init.iocccpasswd.json
+#
+USERNAME = '12345678-1234-4321-abcd-1234567890ab'
+DISABLED_USERNAME = '00000000-0000-4000-8000-000000000000'
+
+
+# directory holding the initial files of the app directory
+#
+ETC_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'etc')
+
+
+@pytest.fixture(name='appdir')
+def fixture_appdir(tmp_path, monkeypatch):
+    """
+    Setup a private app directory and point ioccc_common at it
+
+    Returns:
+        path of the app directory
+    """
+
+    # build the app directory
+    #
+    topdir = str(tmp_path)
+    for subdir in ('etc', 'users', 'staged', 'unexpected'):
+        os.makedirs(os.path.join(topdir, subdir))
+    for filename in ('init.iocccpasswd.json', 'init.state.json', 'iocccpasswd.lock', 'state.lock'):
+        shutil.copy(os.path.join(ETC_SRC, filename), os.path.join(topdir, 'etc', filename))
+    with open(os.path.join(topdir, 'etc', '.secret'), 'w', encoding='utf-8') as secret:
+        secret.write('abcdefghijklmnopqrstuvwxyz0123456789\n')
+
+    # change_startup_appdir() changes directory, so restore it afterwards
+    #
+    monkeypatch.chdir(topdir)
+    assert ioccc_common.change_startup_appdir(topdir)
+    return topdir
+
+
+def settle_file_stamps(monkeypatch):
+    """
+    Treat every file as settled so that the caches may be used right away
+    """
+
+    monkeypatch.setattr(ioccc_common, 'FILE_STAMP_SETTLE_SECS', 0)
+    monkeypatch.setattr(ioccc_common, 'SHA256_CACHE_SETTLE_SECS', 0)
+
+
+def fail_if_called(*args, **kwargs):
+    """
+    Replacement for a function that a cache hit must not call
+    """
+
+    raise AssertionError(f'unexpected call with: {args} {kwargs}')
+
+
+def rewrite_in_place(path, old, new):
+    """
+    Rewrite a file in place, replacing old with new, keeping the modification time
+    """
+
+    file_stat = os.stat(path)
+    with open(path, 'r', encoding='utf-8') as rfile:
+        text = rfile.read()
+    assert old in text
+    with open(path, 'w', encoding='utf-8') as wfile:
+        wfile.write(text.replace(old, new, 1))
+    os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+
+# password file cache
+#
+def test_lookup_username_hit_on_unchanged_pwfile(appdir, monkeypatch):
+    """
+    lookup_username() uses the user information of an unchanged password file
+    """
+
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    assert ioccc_common.read_pwfile()
+    monkeypatch.setattr(ioccc_common, 'read_pwfile', fail_if_called)
+    user_dict = ioccc_common.lookup_username(USERNAME)
+    assert user_dict['username'] == USERNAME
+
+
+def test_lookup_username_miss_after_same_size_rewrite(appdir):
+    """
+    lookup_username() reads a recently modified password file again,
+    even when rewritten in place with the same size and modification time
+    """
+
+    assert appdir
+    pwhash = ioccc_common.lookup_username(USERNAME)['pwhash']
+    changed = pwhash[:-1] + ('0' if pwhash[-1] != '0' else '1')
+    rewrite_in_place(ioccc_common.PW_FILE, pwhash, changed)
+    assert ioccc_common.lookup_username(USERNAME)['pwhash'] == changed
+
+
+def test_lookup_username_miss_after_rewrite(appdir, monkeypatch):
+    """
+    lookup_username() reads a settled password file again after it changes
+    """
+
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    assert ioccc_common.lookup_username(USERNAME)['email'] != 'changed@example.org'
+    pw_dict = ioccc_common.read_pwfile()
+    for user in pw_dict:
+        if user['username'] == USERNAME:
+            user['email'] = 'changed@example.org'
+    with open(ioccc_common.PW_FILE, 'w', encoding='utf-8') as j_pw:
+        j_pw.write(ioccc_common.JSON_ENCODER.encode(pw_dict))
+    assert ioccc_common.lookup_username(USERNAME)['email'] == 'changed@example.org'
+
+
+def test_pwfile_writers_forget_known_usernames(appdir, monkeypatch):
+    """
+    replace_pwfile(), copy_pwfile_under_lock() and delete_username() forget the known usernames
+    """
+
+    settle_file_stamps(monkeypatch)
+    pw_dict = ioccc_common.read_pwfile()
+    assert ioccc_common.ioccc_known_usernames_stamp is not None
+    assert ioccc_common.replace_pwfile(pw_dict)
+    assert ioccc_common.ioccc_known_usernames is None
+
+    assert ioccc_common.read_pwfile()
+    assert ioccc_common.copy_pwfile_under_lock(os.path.join(appdir, 'etc', 'copy.json'))
+    assert ioccc_common.ioccc_known_usernames is None
+
+    assert ioccc_common.read_pwfile()
+    assert ioccc_common.delete_username(USERNAME)
+    assert ioccc_common.lookup_username(USERNAME) is None
+
+
+def test_pwfile_cache_does_not_leak_caller_changes(appdir, monkeypatch):
+    """
+    Changes to the values returned by read_pwfile() and lookup_username() do not change the cache
+    """
+
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    pw_dict = ioccc_common.read_pwfile()
+    for user in pw_dict:
+        user['pwhash'] = 'MUTATED'
+    ioccc_common.lookup_username(USERNAME)['pwhash'] = 'MUTATED'
+    monkeypatch.setattr(ioccc_common, 'read_pwfile', fail_if_called)
+    assert ioccc_common.lookup_username(USERNAME)['pwhash'] != 'MUTATED'
+
+
+def test_username_login_allowed_fast_reject(appdir, monkeypatch):
+    """
+    username_login_allowed() rejects an unknown username of an unchanged password file without reading it
+    """
+
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    assert ioccc_common.read_pwfile()
+    monkeypatch.setattr(ioccc_common, 'lookup_username', fail_if_called)
+    assert not ioccc_common.username_login_allowed('abcdef01-2345-4678-9abc-def012345678')
+
+
+def test_username_login_allowed_after_same_size_rewrite(appdir):
+    """
+    username_login_allowed() reads a recently modified password file again,
+    even when rewritten in place with the same size and modification time
+    """
+
+    assert appdir
+    assert ioccc_common.username_login_allowed(USERNAME)
+    new_username = USERNAME[:-1] + 'c'
+    assert not ioccc_common.username_login_allowed(new_username)
+    rewrite_in_place(ioccc_common.PW_FILE, USERNAME, new_username)
+    assert ioccc_common.username_login_allowed(new_username)
+
+
+# JSON file cache
+#
+def write_json_file(path, text):
+    """
+    Write text into a JSON file
+    """
+
+    with open(path, 'w', encoding='utf-8') as wfile:
+        wfile.write(text)
+
+
+def test_read_json_file_hit_on_unchanged_file(appdir, monkeypatch):
+    """
+    read_json_file_nolock() does not parse an unchanged JSON file again
+    """
+
+    settle_file_stamps(monkeypatch)
+    json_file = os.path.join(appdir, 'users', 'test.json')
+    write_json_file(json_file, '{"status": "uploaded"}\n')
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'uploaded'}
+    monkeypatch.setattr(ioccc_common, 'json_loads', fail_if_called)
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'uploaded'}
+
+
+def test_read_json_file_miss_after_rewrite(appdir, monkeypatch):
+    """
+    read_json_file_nolock() reads a settled JSON file again after it is replaced
+    """
+
+    settle_file_stamps(monkeypatch)
+    json_file = os.path.join(appdir, 'users', 'test.json')
+    write_json_file(json_file, '{"status": "uploaded"}\n')
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'uploaded'}
+    write_json_file(json_file + '.tmp', '{"status": "verified", "count": 1}\n')
+    os.replace(json_file + '.tmp', json_file)
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'verified', 'count': 1}
+
+
+def test_read_json_file_miss_after_same_size_rewrite(appdir):
+    """
+    read_json_file_nolock() reads a recently modified JSON file again,
+    even when rewritten in place with the same size and modification time
+    """
+
+    json_file = os.path.join(appdir, 'users', 'test.json')
+    write_json_file(json_file, '{"status": "uploaded"}\n')
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'uploaded'}
+    rewrite_in_place(json_file, 'uploaded', 'verified')
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'verified'}
+
+
+def test_read_json_file_does_not_leak_caller_changes(appdir, monkeypatch):
+    """
+    Changes to the python dictionary returned by read_json_file_nolock() do not change the cache
+    """
+
+    settle_file_stamps(monkeypatch)
+    json_file = os.path.join(appdir, 'users', 'test.json')
+    write_json_file(json_file, '{"status": "uploaded"}\n')
+    ioccc_common.read_json_file_nolock(json_file)['status'] = 'MUTATED'
+    ioccc_common.read_json_file_nolock(json_file)['status'] = 'MUTATED'
+    assert ioccc_common.read_json_file_nolock(json_file) == {'status': 'uploaded'}
+
+
+# state file cache
+#
+def test_read_state_hit_on_unchanged_file(appdir, monkeypatch):
+    """
+    read_state() does not lock and read an unchanged state file again
+    """
+
+    # the first read_state() creates the state file from the initial state file
+    #
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    assert ioccc_common.read_state()
+    open_datetime, close_datetime = ioccc_common.read_state()
+    assert open_datetime and close_datetime
+    monkeypatch.setattr(ioccc_common, 'ioccc_file_lock', fail_if_called)
+    assert ioccc_common.read_state() == (open_datetime, close_datetime)
+
+
+def test_read_state_miss_after_same_size_rewrite(appdir):
+    """
+    read_state() reads a recently modified state file again,
+    even when rewritten in place with the same size and modification time
+    """
+
+    assert appdir
+    open_datetime, close_datetime = ioccc_common.read_state()
+    assert close_datetime.year == 2025
+    rewrite_in_place(ioccc_common.STATE_FILE, '"2025-06-05', '"2026-06-05')
+    assert ioccc_common.read_state() == (open_datetime, close_datetime.replace(year=2026))
+
+
+def test_read_state_miss_after_update_state(appdir, monkeypatch):
+    """
+    read_state() reads a settled state file again after update_state() changes it
+    """
+
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    assert ioccc_common.read_state()[0].year == 2025
+    assert ioccc_common.update_state('2030-01-02 03:04:05.678901 UTC', '2030-02-03 04:05:06.789012 UTC')
+    open_datetime, close_datetime = ioccc_common.read_state()
+    assert (open_datetime.year, close_datetime.month) == (2030, 2)
+
+
+# secret file cache
+#
+def test_return_secret_hit_on_unchanged_file(appdir, monkeypatch):
+    """
+    return_secret() does not read an unchanged secret file again
+    """
+
+    settle_file_stamps(monkeypatch)
+    assert appdir
+    assert ioccc_common.return_secret() == 'abcdefghijklmnopqrstuvwxyz0123456789'
+    monkeypatch.setattr(ioccc_common, 'open', fail_if_called, raising=False)
+    assert ioccc_common.return_secret() == 'abcdefghijklmnopqrstuvwxyz0123456789'
+
+
+def test_return_secret_miss_after_same_size_rewrite(appdir):
+    """
+    return_secret() reads a recently modified secret file again,
+    even when rewritten in place with the same size and modification time
+    """
+
+    assert appdir
+    assert ioccc_common.return_secret() == 'abcdefghijklmnopqrstuvwxyz0123456789'
+    rewrite_in_place(ioccc_common.SECRET_FILE, 'abc', 'xyz')
+    assert ioccc_common.return_secret() == 'xyzdefghijklmnopqrstuvwxyz0123456789'
+
+
+# setup slots
+#
+def test_initialize_user_tree_empty_slot_json_is_an_error(appdir, monkeypatch):
+    """
+    initialize_user_tree() reports an empty slot JSON file and leaves it in place
+    """
+
+    assert ioccc_common.initialize_user_tree(USERNAME)
+    slot_json_file = os.path.join(appdir, 'users', USERNAME, '1', 'slot.json')
+    with open(slot_json_file, 'wb'):
+        pass
+    monkeypatch.setattr(ioccc_common, 'ioccc_setup_slots', set())
+    assert ioccc_common.initialize_user_tree(USERNAME) is None
+    assert os.path.getsize(slot_json_file) == 0
+
+
+# SHA256 cache
+#
+def test_sha256_file_length_hit_on_unchanged_file(appdir, monkeypatch):
+    """
+    sha256_file_length() does not hash an unchanged file again
+    """
+
+    settle_file_stamps(monkeypatch)
+    filename = os.path.join(appdir, 'staged', 'test.txz')
+    with open(filename, 'wb') as wfile:
+        wfile.write(b'x' * 100)
+    hexdigest, length = ioccc_common.sha256_file_length(filename)
+    assert length == 100
+    monkeypatch.setattr(ioccc_common, 'open', fail_if_called, raising=False)
+    assert ioccc_common.sha256_file_length(filename) == (hexdigest, length)
+
+
+def test_sha256_file_length_miss_after_same_size_rewrite(appdir):
+    """
+    sha256_file_length() hashes a recently modified file again,
+    even when rewritten in place with the same size and modification time
+    """
+
+    filename = os.path.join(appdir, 'staged', 'test.txz')
+    with open(filename, 'w', encoding='utf-8') as wfile:
+        wfile.write('x' * 100)
+    hexdigest, length = ioccc_common.sha256_file_length(filename)
+    rewrite_in_place(filename, 'x', 'y')
+    assert ioccc_common.sha256_file_length(filename) == (ioccc_common.sha256_file(filename), length)
+    assert ioccc_common.sha256_file(filename) != hexdigest
+
+
+# change of app directory
+#
+def test_setup_slots_skip_forming_slot_directories(appdir, monkeypatch):
+    """
+    initialize_user_tree() does not form the slot directories of a setup user again
+    """
+
+    assert appdir
+    slots = ioccc_common.initialize_user_tree(USERNAME)
+    assert slots
+    monkeypatch.setattr(ioccc_common, 'makedirs', fail_if_called)
+    assert ioccc_common.initialize_user_tree(USERNAME) == slots
+
+
+def test_change_startup_appdir_clears_caches(appdir, monkeypatch):
+    """
+    change_startup_appdir() forgets what was cached under the previous app directory
+    """
+
+    settle_file_stamps(monkeypatch)
+    filename = os.path.join(appdir, 'staged', 'test.txz')
+    with open(filename, 'wb') as wfile:
+        wfile.write(b'x' * 100)
+    assert ioccc_common.sha256_file_length(filename)
+    assert ioccc_common.initialize_user_tree(USERNAME)
+    assert ioccc_common.read_state()
+    assert ioccc_common.read_state()
+    assert ioccc_common.return_secret()
+    assert ioccc_common.lookup_username(USERNAME)
+    assert ioccc_common.ioccc_known_usernames is not None
+    assert ioccc_common.ioccc_state_cache is not None
+    assert ioccc_common.ioccc_secret_cache is not None
+    assert ioccc_common.ioccc_json_cache
+    assert ioccc_common.ioccc_sha256_cache
+    assert ioccc_common.ioccc_setup_slots
+
+    assert ioccc_common.change_startup_appdir(appdir)
+    assert ioccc_common.ioccc_known_usernames is None
+    assert ioccc_common.ioccc_known_usernames_stamp is None
+    assert ioccc_common.ioccc_state_cache is None
+    assert ioccc_common.ioccc_init_state_bytes is None
+    assert ioccc_common.ioccc_secret_cache is None
+    assert not ioccc_common.ioccc_json_cache
+    assert not ioccc_common.ioccc_sha256_cache
+    assert not ioccc_common.ioccc_setup_slots